@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Script to measure how every day scales on generated inputs.
+
+Runs the parse and each part on generated inputs of sizes 10^2 up to 10^7,
+fits the empirical complexity exponent k of time ~ size^k and reports the
+size at which a stage first exceeds the time budget. Parts are timed on an
+untimed parse.
+
+    uv run python -m benchmarks.complexity 5 8 --max-exponent 6 --budget 5
+"""
+
+import argparse
+import importlib
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+
+from utils import clear_parse_cache
+
+from .generators import GENERATORS
+
+MIN_FIT_NS = 1_000_000  # Ignore runs dominated by fixed overhead
+
+
+def fit_exponent(sizes: list[int], times_ns: list[int]) -> float | None:
+    """Fit k in time ~ size^k with least squares in log-log space.
+
+    Args:
+        sizes: Input sizes
+        times_ns: Run time per size
+
+    Returns:
+        The exponent, or None with fewer than two usable points
+    """
+    points = [(size, ns) for size, ns in zip(sizes, times_ns) if ns >= MIN_FIT_NS]
+    if len(points) < 2:
+        return None
+    log_sizes, log_times = np.log([points]).reshape(-1, 2).T
+    return float(np.polyfit(log_sizes, log_times, 1)[0])
+
+
+def scale_day(day: int, stage: str, exponents: range, budget_s: float, workdir: Path) -> dict:
+    """Time one stage at growing sizes until it exceeds the budget.
+
+    Args:
+        day: The day number
+        stage: "parse", "part1" or "part2"
+        exponents: Powers of ten to use as sizes
+        budget_s: Time budget per run in seconds
+        workdir: Directory for the generated input files
+
+    Returns:
+        Dict with the sizes, times, fitted exponent and wall size
+    """
+    module = importlib.import_module(f"days.day{day:02d}.solution")
+    solve = getattr(module, stage)
+    load = module.data_loader()
+
+    sizes, times_ns, wall = [], [], None
+    for exponent in exponents:
+        size = 10**exponent
+        input_file = workdir / f"day{day:02d}-{size}.txt"
+        if not input_file.exists():
+            input_file.write_text(GENERATORS[day](size))
+        data = load(input_file)
+        if stage != "parse":
+            data = module.parse(data)
+        clear_parse_cache()
+
+        start = perf_counter_ns()
+        solve(data)
+        elapsed = perf_counter_ns() - start
+        del data
+
+        sizes.append(size)
+        times_ns.append(elapsed)
+        if elapsed > budget_s * 1e9:
+            wall = size
+            break
+
+    return {
+        "day": day,
+        "stage": stage,
+        "sizes": sizes,
+        "times_ns": times_ns,
+        "exponent": fit_exponent(sizes, times_ns),
+        "wall": wall,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Measure the empirical complexity of every day")
+    parser.add_argument("days", type=int, nargs="*", help="Day numbers. If not provided, all days.")
+    parser.add_argument("--min-exponent", type=int, default=2, help="Smallest size as a power of ten")
+    parser.add_argument("--max-exponent", type=int, default=7, help="Largest size as a power of ten")
+    parser.add_argument("--budget", type=float, default=10.0, help="Seconds per run before a day hits the wall")
+    args = parser.parse_args()
+
+    os.environ["AOC_PARSE_CACHE"] = "0"
+    days = args.days or sorted(GENERATORS)
+    exponents = range(args.min_exponent, args.max_exponent + 1)
+
+    print(f"{'Day':>3}  {'Stage':>5}  {'Exponent':>8}  {'Largest size':>12}  {'Time (s)':>9}  {'Wall':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for day in days:
+            for stage in ("parse", "part1", "part2"):
+                result = scale_day(day, stage, exponents, args.budget, Path(workdir))
+                exponent = f"{result['exponent']:.2f}" if result["exponent"] is not None else "-"
+                wall = f"{result['wall']:.0e}" if result["wall"] else "-"
+                print(
+                    f"{day:>3}  {stage:>5}  {exponent:>8}  {result['sizes'][-1]:>12.0e}  "
+                    f"{result['times_ns'][-1] / 1e9:>9.3f}  {wall:>8}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Seeded generators of synthetic puzzle inputs of any size.
+
+Every generator takes a size and a seed and returns the text of an input
+file. The size is the natural record count of the day: rotations, ranges,
+banks, problems or points. For grid days it is the number of cells.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+
+def _join(values) -> str:
+    return "\n".join(values)
+
+
+def generate_day01(size: int, seed: int = 0) -> str:
+    """Dial rotations with amounts up to 999."""
+    rng = np.random.default_rng(seed)
+    directions = rng.choice(np.array(["L", "R"]), size)
+    amounts = rng.integers(1, 1000, size)
+    return _join(np.char.add(directions, amounts.astype(str)))
+
+
+def generate_day02(size: int, seed: int = 0) -> str:
+    """ID ranges below 10^15 up to 10^9 wide."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(1, 10**15, size)
+    ends = starts + rng.integers(0, 10**9, size)
+    return ",".join(f"{start}-{end}" for start, end in zip(starts.tolist(), ends.tolist()))
+
+
+def generate_day03(size: int, seed: int = 0) -> str:
+    """Banks of 100 battery digits."""
+    rng = np.random.default_rng(seed)
+    digits = rng.integers(ord("1"), ord("9") + 1, (size, 100), dtype=np.uint8)
+    return _join(row.tobytes().decode() for row in digits)
+
+
+def generate_day04(size: int, seed: int = 0) -> str:
+    """Square floorplan of about size cells, 60% rolls."""
+    rng = np.random.default_rng(seed)
+    side = max(1, round(size**0.5))
+    grid = np.where(rng.random((side, side)) < 0.6, ord("@"), ord(".")).astype(np.uint8)
+    return _join(row.tobytes().decode() for row in grid)
+
+
+def generate_day05(size: int, seed: int = 0) -> str:
+    """Fresh ranges below 10^15 up to 10^12 wide, and as many IDs."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(1, 10**15, size)
+    ends = starts + rng.integers(0, 10**12, size)
+    ids = rng.integers(1, 10**15, size)
+    ranges = (f"{start}-{end}" for start, end in zip(starts.tolist(), ends.tolist()))
+    return _join([*ranges, "", *ids.astype(str)])
+
+
+def generate_day06(size: int, seed: int = 0) -> str:
+    """Worksheet of problems with 4 numbers below 10^4 each."""
+    rng = np.random.default_rng(seed)
+    numbers = rng.integers(1, 10**4, (size, 4))
+    operators = rng.choice(np.array(["+", "*"]), size)
+    right_aligned = rng.random(size) < 0.5
+
+    rows = [[] for _ in range(5)]
+    for problem, operator, right in zip(numbers.astype(str).tolist(), operators, right_aligned):
+        width = max(len(number) for number in problem)
+        for row, number in zip(rows, problem):
+            row.append(number.rjust(width) if right else number.ljust(width))
+        rows[4].append(operator.ljust(width))
+    return _join(" ".join(row) for row in rows)
+
+
+def generate_day07(size: int, seed: int = 0) -> str:
+    """Square manifold of about size cells, splitters on every other row."""
+    rng = np.random.default_rng(seed)
+    side = max(3, round(size**0.5))
+    grid = np.full((side, side), ord("."), dtype=np.uint8)
+    grid[0, side // 2] = ord("S")
+    splitter_rows = grid[2::2]
+    splitter_rows[rng.random(splitter_rows.shape) < 0.2] = ord("^")
+    return _join(row.tobytes().decode() for row in grid)
+
+
+def generate_day08(size: int, seed: int = 0) -> str:
+    """Junction boxes uniformly spread over a cube of side 10^5."""
+    rng = np.random.default_rng(seed)
+    points = rng.integers(0, 10**5, (size, 3)).astype(str)
+    return _join(",".join(point) for point in points.tolist())
+
+
+GENERATORS: dict[int, Callable[[int, int], str]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+}
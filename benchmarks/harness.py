@@ -0,0 +1,53 @@
+"""Warmed-up, repeated timing of day parts against a stored baseline."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter_ns
+
+from utils import clear_parse_cache
+from utils.decoratos import Timing
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+
+def measure(solve: Callable, load: Callable, name: str, warmup: int, rounds: int) -> Timing:
+    """Time a stage over several rounds after some untimed warmup runs.
+
+    The argument is loaded with load and the in-process parse cache is
+    cleared before every run, neither is timed.
+
+    Args:
+        solve: The parse or part function
+        load: Returns the argument for solve, the raw input or the parsed model
+        name: Name of the timing
+        warmup: Number of untimed runs
+        rounds: Number of timed runs
+
+    Returns:
+        The timing with one sample per round
+    """
+    timing = Timing(name)
+    for run in range(warmup + rounds):
+        data = load()
+        clear_parse_cache()
+        start = perf_counter_ns()
+        solve(data)
+        elapsed = perf_counter_ns() - start
+        if run >= warmup:
+            timing.samples_ns.append(elapsed)
+    return timing
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> dict[str, dict]:
+    """Load the stored timings by case name, empty if there is no baseline yet."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: dict[str, dict], path: Path = BASELINE_FILE) -> None:
+    """Store timings by case name, merging into the existing baseline."""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    path.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
@@ -0,0 +1,82 @@
+"""Scale real puzzle inputs up into larger valid inputs of the same shape."""
+
+from collections.abc import Callable
+
+
+def _lines(text: str) -> list[str]:
+    return text.rstrip("\n").split("\n")
+
+
+def scale_day01(text: str, factor: int) -> str:
+    """Repeat the rotations."""
+    return "\n".join([text.rstrip("\n")] * factor)
+
+
+def scale_day02(text: str, factor: int) -> str:
+    """Shift copies of the ranges up by whole digit lengths."""
+    ranges = [tuple(map(int, r.split("-"))) for r in text.strip().split(",")]
+    width = len(str(max(end for _, end in ranges)))
+    copies = []
+    for k in range(factor):
+        # Prefixing k keeps the digit pattern structure of every ID
+        offset = k * 10**width
+        copies.extend(f"{start + offset}-{end + offset}" for start, end in ranges)
+    return ",".join(copies)
+
+
+def scale_day03(text: str, factor: int) -> str:
+    """Repeat the banks."""
+    return "\n".join(_lines(text) * factor)
+
+
+def scale_day04(text: str, factor: int) -> str:
+    """Stack copies of the floorplan vertically."""
+    return "\n".join(_lines(text) * factor)
+
+
+def scale_day05(text: str, factor: int) -> str:
+    """Shift copies of the ranges and IDs past each other."""
+    lines = _lines(text)
+    blank = lines.index("")
+    ranges = [tuple(map(int, r.split("-"))) for r in lines[:blank]]
+    ids = [int(i) for i in lines[blank + 1:]]
+    extent = max(max(end for _, end in ranges), max(ids, default=0)) + 1
+    scaled_ranges, scaled_ids = [], []
+    for k in range(factor):
+        scaled_ranges.extend(f"{start + k * extent}-{end + k * extent}" for start, end in ranges)
+        scaled_ids.extend(str(i + k * extent) for i in ids)
+    return "\n".join(scaled_ranges + [""] + scaled_ids)
+
+
+def scale_day06(text: str, factor: int) -> str:
+    """Place copies of the worksheet side by side."""
+    lines = _lines(text)
+    width = max(len(line) for line in lines)
+    return "\n".join(" ".join([line.ljust(width)] * factor) for line in lines)
+
+
+def scale_day07(text: str, factor: int) -> str:
+    """Repeat the splitter rows below the start row."""
+    lines = _lines(text)
+    return "\n".join(lines[:1] + lines[1:] * factor)
+
+
+def scale_day08(text: str, factor: int) -> str:
+    """Place shifted copies of the junction boxes next to each other."""
+    points = [tuple(map(int, line.split(","))) for line in _lines(text)]
+    extent = max(x for x, _, _ in points) + 1
+    return "\n".join(
+        f"{x + k * extent},{y},{z}" for k in range(factor) for x, y, z in points
+    )
+
+
+SCALERS: dict[int, Callable[[str, int], str]] = {
+    1: scale_day01,
+    2: scale_day02,
+    3: scale_day03,
+    4: scale_day04,
+    5: scale_day05,
+    6: scale_day06,
+    7: scale_day07,
+    8: scale_day08,
+}
@@ -0,0 +1,95 @@
+"""Performance regression suite for every day and part.
+
+Run with ``uv run pytest benchmarks --benchmark``. The first run, or a run
+with ``--benchmark-update``, stores the timing statistics of every stage in
+``benchmarks/baseline.json``. Later runs fail when the fastest round of a
+stage is slower than the fastest round stored in the baseline (``min_ns``)
+by more than ``--benchmark-factor``.
+Parsing is a stage of its own, the parts are timed on one shared parse.
+"""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from .harness import load_baseline, measure, save_baseline
+from .scaling import SCALERS
+
+DAYS_DIR = Path(__file__).parent.parent / "days"
+NOISE_NS = 1_000_000
+STAGES = ("parse", "part1", "part2")
+CASES = [
+    (day, stage, kind)
+    for day in sorted(SCALERS)
+    for stage in STAGES
+    for kind in ("input", "scaled")
+]
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collect the timings of the session and store them as the baseline when asked."""
+    results = {}
+    yield results
+    if results and (request.config.getoption("--benchmark-update") or not load_baseline()):
+        save_baseline(results)
+
+
+@pytest.fixture(scope="session")
+def scaled_inputs(tmp_path_factory):
+    """Write the scaled synthetic input of every day once per session."""
+    paths = {}
+
+    def get(day: int, factor: int) -> Path:
+        if (day, factor) not in paths:
+            text = (DAYS_DIR / f"day{day:02d}" / "input.txt").read_text()
+            path = tmp_path_factory.mktemp(f"day{day:02d}") / f"scaled{factor}.txt"
+            path.write_text(SCALERS[day](text, factor))
+            paths[day, factor] = path
+        return paths[day, factor]
+
+    return get
+
+
+@pytest.mark.parametrize("day,stage,kind", CASES, ids=[f"day{d:02d}-{s}-{k}" for d, s, k in CASES])
+def test_benchmark(day, stage, kind, request, benchmark_results, scaled_inputs, monkeypatch):
+    """Time a stage and compare it against the baseline."""
+    config = request.config
+    if not config.getoption("--benchmark"):
+        pytest.skip("benchmarks run with --benchmark")
+    monkeypatch.setenv("AOC_PARSE_CACHE", "0")
+
+    module = importlib.import_module(f"days.day{day:02d}.solution")
+    if kind == "input":
+        input_file = DAYS_DIR / f"day{day:02d}" / "input.txt"
+    else:
+        input_file = scaled_inputs(day, config.getoption("--benchmark-scale"))
+    loader = module.data_loader()
+    if stage == "parse":
+        load = lambda: loader(input_file)
+    else:
+        model = module.parse(loader(input_file))
+        load = lambda: model
+
+    name = f"day{day:02d}/{stage}/{kind}"
+    timing = measure(
+        getattr(module, stage),
+        load,
+        name,
+        warmup=config.getoption("--benchmark-warmup"),
+        rounds=config.getoption("--benchmark-rounds"),
+    )
+    benchmark_results[name] = timing.to_dict()
+
+    baseline = load_baseline().get(name)
+    if baseline is None or config.getoption("--benchmark-update"):
+        return
+    # The fastest round is the least disturbed by other load, and very short
+    # parts get an absolute allowance for timer and scheduler noise
+    factor = config.getoption("--benchmark-factor")
+    allowed = max(baseline["min_ns"] * factor, baseline["min_ns"] + NOISE_NS)
+    assert timing.min_ns <= allowed, (
+        f"{name} took {timing.min_ns / 1e6:.3f} ms, baseline "
+        f"{baseline['min_ns'] / 1e6:.3f} ms x {factor}"
+    )
@@ -0,0 +1,31 @@
+"""Tests for the synthetic input generators."""
+
+import importlib
+
+import pytest
+
+from .complexity import fit_exponent
+from .generators import GENERATORS
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generator_solvable(day, tmp_path):
+    """Test that generated inputs are deterministic and solvable."""
+    text = GENERATORS[day](100, seed=1)
+    assert text == GENERATORS[day](100, seed=1)
+    assert text != GENERATORS[day](100, seed=2)
+
+    module = importlib.import_module(f"days.day{day:02d}.solution")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(text)
+    model = module.parse(module.data_loader()(input_file))
+    for part in (module.part1, module.part2):
+        assert part(model) is not None
+
+
+def test_fit_exponent():
+    """Test the fitted exponent of a known quadratic."""
+    sizes = [10**2, 10**3, 10**4]
+    exponent = fit_exponent(sizes, [size**2 for size in sizes])
+    assert exponent == pytest.approx(2.0)
+    print(f"✓ Fit exponent: {exponent}")
@@ -0,0 +1,33 @@
+"""Shared test fixtures and the command line options of the benchmark suite."""
+
+import pytest
+
+from utils import cache
+
+
+@pytest.fixture(autouse=True, scope="session")
+def parse_cache_dir(tmp_path_factory):
+    """Keep the disk parse cache of test runs out of the repository's ``.cache/``."""
+    with pytest.MonkeyPatch.context() as patch:
+        directory = tmp_path_factory.mktemp("parse-cache")
+        patch.setenv("AOC_CACHE_DIR", str(directory))
+        patch.setattr(cache, "CACHE_DIR", directory)
+        yield directory
+
+
+def pytest_addoption(parser):
+    """Add the options of the benchmark suite."""
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", help="Run the performance benchmarks")
+    group.addoption(
+        "--benchmark-update", action="store_true", help="Store the timings as the new baseline"
+    )
+    group.addoption(
+        "--benchmark-factor",
+        type=float,
+        default=1.5,
+        help="Fail when a part is this many times slower than the baseline",
+    )
+    group.addoption("--benchmark-warmup", type=int, default=1, help="Untimed runs per part")
+    group.addoption("--benchmark-rounds", type=int, default=5, help="Timed runs per part")
+    group.addoption("--benchmark-scale", type=int, default=10, help="Size factor of the scaled inputs")
@@ -1,78 +1,203 @@
 """Advent of Code - Day 01 Solution"""
 
+from collections.abc import Iterable, Sequence
+from functools import partial
+from itertools import batched
 from pathlib import Path
-import re
-from utils import read_input_lines
 
+import numpy as np
 
-def part1(data: list[str]) -> int:
-    """Solve part 1 of the puzzle.
+from utils import parallel_map, stream_lines
+
+START = 50
+DIGITS = 100  # 0-99 inclusive
+CHUNK_LINES = 1 << 16  # Rotations parsed and summarised per chunk
+PARALLEL_CHUNKS = 4  # Summarise chunks on the process pool from this many chunks
+
+
+def parse_rotations(data: Sequence[str]) -> np.ndarray:
+    """Parse rotation instructions into a signed int64 array in one pass.
+
+    The lines are scanned as bytes: every ``L``/``R`` starts a record and the
+    digits following it are combined with powers of ten per record.
 
     Args:
-        data: The puzzle input as a string
+        data: Lines like ``L68`` or ``R48``
 
     Returns:
-        The solution to part 1
+        Array with positive amounts for right and negative for left rotations
+    """
+    buf = np.frombuffer("\n".join(data).encode(), dtype=np.uint8)
+    starts = np.flatnonzero((buf == ord("L")) | (buf == ord("R")))
+    digit_idx = np.flatnonzero((buf >= ord("0")) & (buf <= ord("9")))
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    record = np.searchsorted(starts, digit_idx, side="right") - 1
+    group_starts = np.flatnonzero(np.diff(record, prepend=-1))
+    group_ends = np.append(group_starts[1:], len(digit_idx)) - 1
+    last_digit = np.repeat(digit_idx[group_ends], group_ends - group_starts + 1)
+    power = (last_digit - digit_idx).astype(np.int64)
+    contrib = (buf[digit_idx].astype(np.int64) - ord("0")) * 10**power
+    amounts = np.add.reduceat(contrib, group_starts)
+
+    signs = np.where(buf[starts[record[group_starts]]] == ord("R"), 1, -1)
+    return signs * amounts
+
+
+def parse(raw: Iterable[str]) -> np.ndarray:
+    """Parse a stream of rotation lines chunk by chunk into one array.
+
+    Args:
+        raw: Lines like ``L68`` or ``R48``
+
+    Returns:
+        Read-only signed array of all rotations
+    """
+    chunks = [parse_rotations(chunk) for chunk in batched(raw, CHUNK_LINES)]
+    rotations = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+    rotations.flags.writeable = False
+    return rotations
+
+
+def summarise_chunk(rotations: np.ndarray, crossings: bool) -> tuple[int, np.ndarray]:
+    """Count the zeros of a chunk for every possible start position at once.
+
+    Positions are the prefix sums of the rotations relative to the start s.
+    With ``floor((s + x) / DIGITS) = x // DIGITS + (x % DIGITS >= DIGITS - s)``
+    every count splits into a start independent part and threshold tests on
+    residues, which a histogram over the residues answers for all starts.
+    Chunks can therefore be summarised independently of each other.
+
+    Args:
+        rotations: Signed rotations of the chunk
+        crossings: Count every pass over zero instead of only landings
+
+    Returns:
+        The net rotation modulo DIGITS and the number of zeros per start position
+    """
+    if len(rotations) == 0:
+        return 0, np.zeros(DIGITS, dtype=np.int64)
+    offsets = np.cumsum(rotations)
+    starts = np.arange(DIGITS)
+
+    if not crossings:
+        # Lands on zero when (s + offset) % DIGITS == 0
+        landings = np.bincount(offsets % DIGITS, minlength=DIGITS)
+        return int(offsets[-1] % DIGITS), landings[-starts % DIGITS]
+
+    before = np.concatenate(([0], offsets[:-1]))
+    right = rotations > 0
+    # Multiples of DIGITS in (before, after] going right and in [after, before)
+    # going left, as floor(upper / DIGITS) - floor(lower / DIGITS)
+    upper = np.where(right, offsets, before - 1)
+    lower = np.where(right, before, offsets - 1)
+    base = int((upper // DIGITS - lower // DIGITS).sum())
+    weights = np.bincount(upper % DIGITS, minlength=DIGITS) - np.bincount(lower % DIGITS, minlength=DIGITS)
+    at_least = np.append(np.cumsum(weights[::-1])[::-1], 0)  # at_least[k] = sum of weights[k:]
+    return int(offsets[-1] % DIGITS), base + at_least[DIGITS - starts]
+
+
+def summarise_lines(lines: Sequence[str], crossings: bool) -> tuple[int, np.ndarray]:
+    """Parse and summarise a chunk of rotation lines, see summarise_chunk."""
+    return summarise_chunk(parse_rotations(lines), crossings)
+
+
+def follow_dial(summaries: Iterable[tuple[int, np.ndarray]], start: int = START) -> int:
+    """Carry the dial position through chunk summaries and add up their zeros.
+
+    Args:
+        summaries: Net rotation and zeros per start position of every chunk, in order
+        start: Starting dial position
+
+    Returns:
+        Number of times the dial pointed at zero
     """
-    START = 50
-    DIGITS = 100 # 0-99 inclusive
-    current = START
+    current = start % DIGITS
     number_of_zeros = 0
-    for line in data:
-        reg = r"([L|R])(\d+)"
-        match = re.match(reg, line)
-        if match:
-            sign = +1 if match.group(1) == "R" else -1
-            amount = int(match.group(2))
-            current += sign * amount
-            POS = current % DIGITS
-            if POS == 0:
-                number_of_zeros += 1
+    for net_rotation, zeros in summaries:
+        number_of_zeros += int(zeros[current])
+        current = (current + net_rotation) % DIGITS
     return number_of_zeros
 
 
-def part2(data: list[str]) -> int:
+def count_zeros(
+    rotations: np.ndarray, crossings: bool, start: int = START, chunk_size: int = CHUNK_LINES
+) -> int:
+    """Count how often the dial points at zero over the rotation log.
+
+    The log is split into chunks that are summarised independently, in
+    parallel for long logs, and only the dial position is carried between
+    them.
+
+    Args:
+        rotations: Signed rotations
+        crossings: Count every pass over zero instead of only landings
+        start: Starting dial position
+        chunk_size: Rotations per chunk
+
+    Returns:
+        Number of times the dial pointed at zero
+    """
+    chunks = (rotations[i:i + chunk_size] for i in range(0, len(rotations), chunk_size))
+    summarise = partial(summarise_chunk, crossings=crossings)
+    return follow_dial(parallel_map(summarise, chunks, min_items=PARALLEL_CHUNKS), start)
+
+
+def solve_stream(lines: Iterable[str], part: int, start: int = START) -> int:
+    """Solve a part from a stream of rotation lines, one chunk at a time.
+
+    Every chunk is reduced to its net rotation and zeros per start position
+    right after parsing. Long logs are summarised on the process pool.
+
+    Args:
+        lines: Lines like ``L68`` or ``R48``
+        part: The part to solve
+        start: Starting dial position
+
+    Returns:
+        The solution to the part
+    """
+    summarise = partial(summarise_lines, crossings=part == 2)
+    return follow_dial(parallel_map(summarise, batched(lines, CHUNK_LINES), min_items=PARALLEL_CHUNKS), start)
+
+
+def part1(rotations: np.ndarray) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        rotations: The parsed rotations
+
+    Returns:
+        The solution to part 1
+    """
+    return count_zeros(rotations, crossings=False)
+
+
+def part2(rotations: np.ndarray) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        rotations: The parsed rotations
 
     Returns:
         The solution to part 2
     """
-    START = 50
-    DIGITS = 100 # 0-99 inclusive
-    current = START
-    number_of_zeros = 0
-    for line in data:
-        reg = r"([L|R])(\d+)"
-        match = re.match(reg, line)
-        if match:
-            sign = +1 if match.group(1) == "R" else -1
-            amount = int(match.group(2))
-            # Check for full spins, full spins don't matter direction
-            number_of_spins = amount // DIGITS
-            number_of_zeros += number_of_spins
-            # Handle remaining movement
-            amount_remaining = amount % DIGITS
-            max_range = 100 if current == 0 else DIGITS - current if sign == +1 else current
-            if amount_remaining >= max_range:
-                # Will cross zero
-                number_of_zeros += 1
-
-            current += sign * amount_remaining
-            current %= DIGITS
-            
-    return number_of_zeros
+    return count_zeros(rotations, crossings=True)
+
 
+def data_loader():
+    """Returns a function that load the input data"""
+    # Parsed chunk by chunk, so stream the file
+    return stream_lines
 
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = read_input_lines(input_file)
+    rotations = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(rotations)}")
+    print(f"Part 2: {part2(rotations)}")
 
 
 if __name__ == "__main__":
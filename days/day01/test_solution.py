@@ -3,8 +3,8 @@
 import sys
 from pathlib import Path
 
-from utils import read_input_lines
-from .solution import part1, part2
+from utils import read_input_lines, stream_lines
+from .solution import parse, part1, part2, count_zeros, solve_stream
 
 
 def test_part1():
@@ -12,7 +12,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = read_input_lines(test_file)
     expected = 3
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1: {result}")
 
@@ -22,7 +22,7 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = read_input_lines(test_file)
     expected = 6
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2: {result}")
 
@@ -35,17 +35,37 @@ def test_part2_additional():
         "R1",    # 49 -> 50
     ]
     expected = 5  # Crossed zero 5 times
-    result = part2(test_data)
+    result = part2(parse(test_data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Additional: {result}")
 
 
+def test_chunked():
+    """Test that chunks carry the dial position across boundaries."""
+    test_file = Path(__file__).parent / "test1.txt"
+    rotations = parse(read_input_lines(test_file))
+    assert count_zeros(rotations, crossings=False, chunk_size=3) == 3
+    assert count_zeros(rotations, crossings=True, chunk_size=3) == 6
+    print("✓ Chunked: 3, 6")
+
+
+def test_solve_stream():
+    """Test that the streaming path gives the same answers as the parsed one."""
+    test_file = Path(__file__).parent / "test1.txt"
+    for part, expected in ((1, 3), (2, 6)):
+        result = solve_stream(stream_lines(test_file), part)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ Solve stream: 3, 6")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
         ("Part 2 Example 2", test_part2_additional),
+        ("Chunked", test_chunked),
+        ("Solve stream", test_solve_stream),
     ]
 
     print("Running tests...\n")
@@ -1,64 +1,147 @@
 """Advent of Code - Day 02 Solution"""
 
+from functools import partial
 from pathlib import Path
-import re
 
-from utils import read_input, timeit
+from utils import parallel_map, read_input
 
-@timeit
-def part1(data: str) -> int:
-    """Solve part 1 of the puzzle.
+
+def parse(data: str) -> tuple[tuple[int, int], ...]:
+    """Parse the comma separated ``start-end`` ranges.
 
     Args:
         data: The puzzle input as a string
 
+    Returns:
+        Tuple of inclusive (start, end) tuples
+    """
+    ranges = []
+    for _range in data.split(","):
+        start, end = map(int, _range.split("-"))
+        ranges.append((start, end))
+    return tuple(ranges)
+
+
+def divisors(n: int) -> list[int]:
+    """Return all divisors of n in ascending order."""
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def mobius(n: int) -> int:
+    """Return the Mobius function of n."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def periodic_sum(start: int, end: int, length: int, block: int) -> int:
+    """Sum the ``length`` digit numbers in [start, end] built by repeating a ``block`` digit pattern.
+
+    Every such number is ``pattern * multiplier`` where the multiplier is the
+    repunit ``1 0..0 1 0..0 1`` of the given length, so the patterns inside the
+    range form a contiguous run and their sum is an arithmetic series.
+
+    Args:
+        start: Inclusive lower bound
+        end: Inclusive upper bound
+        length: Number of digits of the numbers
+        block: Number of digits of the repeated pattern, must divide length
+
+    Returns:
+        Sum of all matching numbers in the range
+    """
+    multiplier = (10**length - 1) // (10**block - 1)
+    low = max(10 ** (block - 1), -(-start // multiplier))
+    high = min(10**block - 1, end // multiplier)
+    if low > high:
+        return 0
+    return multiplier * (low + high) * (high - low + 1) // 2
+
+
+def invalid_sum(start: int, end: int, halves_only: bool) -> int:
+    """Sum the invalid IDs in [start, end] without enumerating the range.
+
+    The range is cut per digit length. For part 1 only patterns repeated exactly
+    twice count. For part 2 a number may be periodic in several block sizes
+    (``12121212`` is both ``12`` x4 and ``1212`` x2), so the sums over proper
+    divisors of the length are combined with Mobius inclusion-exclusion to count
+    every number once.
+
+    Args:
+        start: Inclusive lower bound
+        end: Inclusive upper bound
+        halves_only: Only count patterns repeated exactly twice
+
+    Returns:
+        Sum of the invalid IDs in the range
+    """
+    total = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        if low > high:
+            continue
+        if halves_only:
+            if length % 2 == 0:
+                total += periodic_sum(low, high, length, length // 2)
+            continue
+        for block in divisors(length)[:-1]:
+            sign = -mobius(length // block)
+            if sign:
+                total += sign * periodic_sum(low, high, length, block)
+    return total
+
+
+def range_invalid_sum(_range: tuple[int, int], halves_only: bool) -> int:
+    """Sum the invalid IDs of one (start, end) range, see invalid_sum."""
+    start, end = _range
+    return invalid_sum(start, end, halves_only)
+
+
+def part1(ranges: tuple[tuple[int, int], ...]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        ranges: The parsed (start, end) ranges
+
     Returns:
         The solution to part 1
     """
-    ranges = data.split(",")
-    invalid_ids = list()
-    for _range in ranges:
-        (start, end) = tuple(map(int, _range.split("-")))
-        for _id in range(start, end+1):
-            id_str = str(_id)
-            length = len(id_str)
-            part1, part2 = id_str[:length//2], id_str[length//2:]
-            if part1 == part2 and len(part1) == len(part2):
-                invalid_ids.append(_id)
-
-    return sum(invalid_ids)
-
-@timeit
-def part2(data: str) -> int:
+    return sum(parallel_map(partial(range_invalid_sum, halves_only=True), ranges))
+
+
+def part2(ranges: tuple[tuple[int, int], ...]) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        ranges: The parsed (start, end) ranges
 
     Returns:
         The solution to part 2
     """
-    ranges = data.split(",")
-    invalid_ids = list()
-    for _range in ranges:
-        (start, end) = tuple(map(int, _range.split("-")))
-        for _id in range(start, end+1):
-            id_str = str(_id)
-            regex = r"(\d+)(\1+)"
-            match = re.fullmatch(regex, id_str)
-            if match:
-                invalid_ids.append(_id)
+    return sum(parallel_map(partial(range_invalid_sum, halves_only=False), ranges))
 
-    return sum(invalid_ids)
 
+def data_loader():
+    """Returns a function that load the input data"""
+    return read_input
 
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = read_input(input_file)
+    ranges = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(ranges)}")
+    print(f"Part 2: {part2(ranges)}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """Tests for Advent of Code - Day 02"""
 
+import re
 import sys
 from pathlib import Path
 
 from utils import read_input
-from .solution import part1, part2
+from .solution import parse, part1, part2, invalid_sum
 
 
 def test_part1():
@@ -12,7 +13,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = read_input(test_file)
     expected = 1227775554
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -22,16 +23,39 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = read_input(test_file)
     expected = 4174379265
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_invalid_sum_matches_brute_force():
+    """Test the closed form sums against enumerating every ID."""
+    start, end = 1, 250000
+    ids = [str(_id) for _id in range(start, end + 1)]
+    expected1 = sum(int(i) for i in ids if i[: len(i) // 2] * 2 == i)
+    expected2 = sum(int(i) for i in ids if re.fullmatch(r"(\d+)(\1+)", i))
+    assert invalid_sum(start, end, True) == expected1
+    assert invalid_sum(start, end, False) == expected2
+    print(f"✓ Brute force: {expected1}, {expected2}")
+
+
+def test_huge_range():
+    """Test a range far too wide to enumerate."""
+    data = "1-999999999999999999"
+    result = part2(parse(data))
+    # Every 2 digit repdigit is invalid, and counted once
+    assert invalid_sum(10, 99, False) == sum(range(11, 100, 11))
+    assert result > part1(parse(data))
+    print(f"✓ Huge range: {result}")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Brute force", test_invalid_sum_matches_brute_force),
+        ("Huge range", test_huge_range),
     ]
 
     print("Running tests...\n")
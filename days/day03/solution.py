@@ -1,70 +1,199 @@
 """Advent of Code - Day 03 Solution"""
 
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from functools import partial
+from itertools import batched
+from math import log10
+
 import numpy as np
 from pathlib import Path
 
-from utils import read_input, read_input_lines
+from utils import parallel_map, stream_lines
 
-READ_LINES = True  # Set to False to use read_input
+BATCH_BANKS = 1 << 14  # Banks resolved per 2-D batch
+PARALLEL_BATCHES = 2  # Resolve batches on the process pool from this many batches
 
 
-def part1(data: list[str] | str) -> int:
-    """Solve part 1 of the puzzle.
+def max_joltage(bank: str, k: int) -> int:
+    """Find the largest k digit number that is a subsequence of the bank.
+
+    Single pass greedy monotonic stack: a digit pops smaller digits off the
+    stack as long as enough digits remain to still fill k places.
 
     Args:
-        data: The puzzle input as a string
+        bank: String of battery digits
+        k: Number of batteries to turn on
 
     Returns:
-        The solution to part 1
+        The largest joltage the bank can produce
+    """
+    n = len(bank)
+    stack = []
+    for i, digit in enumerate(bank):
+        while stack and stack[-1] < digit and len(stack) - 1 + n - i >= k:
+            stack.pop()
+        if len(stack) < k:
+            stack.append(digit)
+    return int("".join(stack))
+
+
+def max_joltage_batch(banks: np.ndarray, k: int) -> np.ndarray:
+    """Resolve the monotonic stack for many equal length banks at once.
+
+    Args:
+        banks: 2-D uint8 array with one bank of digit values per row
+        k: Number of batteries to turn on
+
+    Returns:
+        Array with the largest joltage per bank
+    """
+    rows, n = banks.shape
+    r = np.arange(rows)
+    stack = np.zeros((rows, k), dtype=np.uint8)
+    size = np.zeros(rows, dtype=np.intp)
+    for i in range(n):
+        digits = banks[:, i]
+        while True:
+            top = stack[r, np.maximum(size - 1, 0)]
+            pop = (size > 0) & (top < digits) & (size - 1 + n - i >= k)
+            if not pop.any():
+                break
+            size -= pop
+        push = size < k
+        stack[r[push], size[push]] = digits[push]
+        size += push
+
+    # int64 holds up to 18 digits, fall back to Python ints beyond that
+    dtype = np.int64 if k <= 18 else object
+    magnitudes = np.array([10**n for n in reversed(range(k))], dtype=dtype)
+    return stack.astype(dtype) @ magnitudes
+
+
+def group_banks(banks: Iterable[str]) -> dict[int, np.ndarray]:
+    """Group banks by length into 2-D uint8 arrays of digit values."""
+    groups = defaultdict(list)
+    for bank in banks:
+        if bank:
+            groups[len(bank)].append(bank)
+    return {
+        length: (np.frombuffer("".join(group).encode(), dtype=np.uint8) - ord("0")).reshape(len(group), length)
+        for length, group in groups.items()
+    }
+
+
+def parse(raw: Iterable[str]) -> tuple[np.ndarray, ...]:
+    """Parse the banks into digit matrices, reading them in batches.
+
+    Banks are grouped by length so each group can be solved as one 2-D
+    array.
+
+    Args:
+        raw: Banks of battery digits
+
+    Returns:
+        Read-only 2-D uint8 arrays of digit values, one per bank length
+    """
+    groups = defaultdict(list)
+    for batch in batched(raw, BATCH_BANKS):
+        for length, digits in group_banks(batch).items():
+            groups[length].append(digits)
+
+    matrices = []
+    for length in sorted(groups):
+        digits = np.concatenate(groups[length])
+        digits.flags.writeable = False
+        matrices.append(digits)
+    return tuple(matrices)
+
+
+def total_joltage(banks: tuple[np.ndarray, ...], k: int) -> int:
+    """Sum the largest joltage of every bank.
+
+    Every matrix is resolved in batches of rows, in parallel for long
+    inputs.
+
+    Args:
+        banks: Digit matrices, one per bank length
+        k: Number of batteries to turn on per bank
+
+    Returns:
+        The total joltage
+    """
+    batches = (
+        digits[start:start + BATCH_BANKS] for digits in banks for start in range(0, len(digits), BATCH_BANKS)
+    )
+    return sum(parallel_map(partial(batch_joltage, k=k), batches, min_items=PARALLEL_BATCHES))
+
+
+def batch_joltage(batch: np.ndarray, k: int) -> int:
+    """Sum the largest joltage of a batch of equal length banks."""
+    if batch.shape[1] < k:
+        raise ValueError(f"Bank of length {batch.shape[1]} cannot turn on {k} batteries")
+    joltages = max_joltage_batch(batch, k)
+    # Every joltage is below 10^k, sum as Python ints when the int64 total could wrap
+    if joltages.dtype != object and k + log10(max(len(joltages), 1)) >= 18:
+        joltages = joltages.astype(object)
+    return int(joltages.sum())
+
+
+def lines_joltage(lines: Sequence[str], k: int) -> int:
+    """Sum the largest joltage of a batch of banks given as lines."""
+    return sum(batch_joltage(digits, k) for digits in group_banks(lines).values())
+
+
+def solve_stream(lines: Iterable[str], part: int) -> int:
+    """Solve a part batch by batch, without grouping the whole file by length.
+
+    Only the batches in flight are held, on the process pool for long inputs.
+
+    Args:
+        lines: Banks of battery digits
+        part: The part to solve
+
+    Returns:
+        The solution to the part
     """
-    total_jolts = 0
-    for bank in data:
-        bank_digits = [int(c) for c in bank]
+    k = 2 if part == 1 else 12
+    batches = batched(lines, BATCH_BANKS)
+    return sum(parallel_map(partial(lines_joltage, k=k), batches, min_items=PARALLEL_BATCHES))
+
 
-        i_left_digit = np.argmax(bank_digits[:-1])
-        i_right_digit = np.argmax(bank_digits[i_left_digit+1:]) + i_left_digit + 1
-        bank_jolts = bank_digits[i_left_digit] * 10 + bank_digits[i_right_digit]
-        total_jolts += bank_jolts
-    return total_jolts
+def part1(banks: tuple[np.ndarray, ...]) -> int:
+    """Solve part 1 of the puzzle.
 
+    Args:
+        banks: The parsed digit matrices
+
+    Returns:
+        The solution to part 1
+    """
+    return total_joltage(banks, 2)
 
 
-def part2(data: list[str] | str) -> int:
+def part2(banks: tuple[np.ndarray, ...]) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        banks: The parsed digit matrices
 
     Returns:
         The solution to part 2
     """
-    total_jolts = 0
-    for bank in data:
-        bank_digits = [int(c) for c in bank]
-        bank_jolts = 0
-        for n in list(reversed(range(12))):
-            magnitude = 10 ** n
-            valid_digits = bank_digits[:-n] if n > 0 else bank_digits
-            i_digit = np.argmax(valid_digits)
-            digit = valid_digits[i_digit]
-            bank_digits = bank_digits[i_digit + 1:]
-            bank_jolts += digit * magnitude
-        total_jolts += bank_jolts
-    return total_jolts
+    return total_joltage(banks, 12)
 
 def data_loader():
     """Returns a function that load the input data"""
-    if READ_LINES:
-        return read_input_lines
-    return read_input
+    # Banks are parsed batch by batch, so stream the file
+    return stream_lines
 
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    banks = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(banks)}")
+    print(f"Part 2: {part2(banks)}")
 
 
 if __name__ == "__main__":
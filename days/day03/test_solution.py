@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+from .solution import parse, part1, part2, data_loader, max_joltage, solve_stream, total_joltage
 
 
 def test_part1():
@@ -11,7 +11,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 357
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +21,43 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 3121910778619
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_max_joltage():
+    """Test the single bank kernel against the batched kernel."""
+    test_file = Path(__file__).parent / "test1.txt"
+    data = list(data_loader()(test_file))
+    for k in (1, 2, 12, 15):
+        expected = sum(max_joltage(bank, k) for bank in data)
+        result = total_joltage(parse(data), k)
+        assert result == expected, f"Expected {expected}, got {result}"
+    assert max_joltage("818181911112111", 12) == 888911112111
+
+    # The int64 sum of many 18 digit joltages would wrap
+    result = total_joltage(parse(["9" * 20] * 20000), 18)
+    assert result == 20000 * (10**18 - 1), f"Expected {20000 * (10**18 - 1)}, got {result}"
+    print("✓ Max joltage")
+
+
+def test_solve_stream():
+    """Test that the streaming path gives the same answers as the parsed one."""
+    test_file = Path(__file__).parent / "test1.txt"
+    for part, expected in ((1, 357), (2, 3121910778619)):
+        result = solve_stream(data_loader()(test_file), part)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ Solve stream: 357, 3121910778619")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Max joltage", test_max_joltage),
+        ("Solve stream", test_solve_stream),
     ]
 
     print("Running tests...\n")
@@ -1,70 +1,265 @@
 """Advent of Code - Day 04 Solution"""
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 import numpy as np
 from scipy import signal
 
-from utils import read_input, read_input_lines, timeit
+from utils import cached_parse, read_input, read_input_lines
+from utils.grid import make_lut, neighbour_counts, parse_grid
+from utils.tiled_grid import TiledGrid
 
 READ_LINES = False  # Set to False to use read_input
 
-@timeit
-def part1(data: list[str]) -> int:
-    """Solve part 1 of the puzzle.
+MAX_NEIGHBOURS = 4  # A roll with fewer neighbours than this can be accessed
+ROLL_LUT = make_lut({"@": 1})
+TILE_SIZE = 256
+
+
+@cached_parse
+def parse_floorplan(data: str) -> np.ndarray:
+    """Parse the floorplan into a zero padded uint8 array with 1 for every roll.
 
     Args:
         data: The puzzle input as a string
 
     Returns:
-        The solution to part 1
+        Padded array of rolls
     """
-    floorplan = np.array([list(row) for row in data.split('\n')])
-    floorplan[floorplan == "@"] = 1
-    floorplan[floorplan == '.'] = 0
-    floorplan = floorplan.astype(int)
-    floorplan = np.pad(floorplan, 1, 'constant', constant_values=0)
+    return np.pad(parse_grid(data, ROLL_LUT), 1, 'constant', constant_values=0)
 
-    count_neighbour_kernel = np.array([[1,1,1], [1,0,1], [1,1,1]])
-    number_of_neighbours = signal.convolve2d(floorplan, count_neighbour_kernel, 'same', boundary="fill", fillvalue=0)
-    valid_rolls = number_of_neighbours < 4
-    valid_rolls = valid_rolls * floorplan
-    
-    return sum(sum(valid_rolls))
 
-def part2(data: list[str]) -> int:
-    """Solve part 2 of the puzzle.
+def parse_tiled(data: str | Iterable[str], tile_size: int = TILE_SIZE) -> TiledGrid:
+    """Parse the floorplan into bit-packed tiles, skipping empty ones.
 
     Args:
-        data: The puzzle input as a string
+        data: The puzzle input as a string, or any iterable of rows
+        tile_size: Side of the square tiles
 
     Returns:
-        The solution to part 2
+        Tiled grid of rolls
     """
-    floorplan = np.array([list(row) for row in data.split('\n')])
-    floorplan[floorplan == "@"] = 1
-    floorplan[floorplan == '.'] = 0
-    floorplan = floorplan.astype(int)
-    floorplan = np.pad(floorplan, 1, 'constant', constant_values=0)
+    lines = data.split("\n") if isinstance(data, str) else data
+    return TiledGrid.from_lines(lines, ROLL_LUT, tile_size)
 
-    number_of_rolls_start = sum(sum(floorplan))
 
-    count_neighbour_kernel = np.array([[1,1,1], [1,0,1], [1,1,1]])
-    number_of_neighbours = signal.convolve2d(floorplan, count_neighbour_kernel, 'same', boundary="fill", fillvalue=0)
-    valid_rolls = number_of_neighbours < 4
-    valid_rolls = valid_rolls * floorplan
-    number_of_valid_rolls = sum(sum(valid_rolls))
-    floorplan = floorplan - valid_rolls
+def parse(data: str | Iterable[str], tiled: bool = False) -> np.ndarray | TiledGrid:
+    """Parse the floorplan for both parts.
+
+    Args:
+        data: The puzzle input as a string, or any iterable of rows when tiled
+        tiled: Store bit-packed tiles instead of a dense array to bound memory use
+
+    Returns:
+        Read-only padded array of rolls, or the tiled grid
+    """
+    if tiled:
+        return parse_tiled(data)
+    return parse_floorplan(data)
+
+
+def count_neighbours(floorplan: np.ndarray) -> np.ndarray:
+    """Count the rolls in the 8 neighbouring cells of every cell."""
+    return neighbour_counts(floorplan, connectivity=8)
+
+
+def peel_convolution(floorplan: np.ndarray) -> int:
+    """Remove accessible rolls round by round, re-convolving the whole grid.
+
+    Reference implementation, costs rounds x H x W.
 
+    Args:
+        floorplan: Padded array of rolls
+
+    Returns:
+        Number of removed rolls
+    """
+    floorplan = floorplan.astype(int)
+    number_of_rolls_start = floorplan.sum()
+    count_neighbour_kernel = np.array([[1,1,1], [1,0,1], [1,1,1]])
+    number_of_valid_rolls = 1
     while number_of_valid_rolls > 0:
-        count_neighbour_kernel = np.array([[1,1,1], [1,0,1], [1,1,1]])
         number_of_neighbours = signal.convolve2d(floorplan, count_neighbour_kernel, 'same', boundary="fill", fillvalue=0)
-        valid_rolls = number_of_neighbours < 4
-        valid_rolls = valid_rolls * floorplan
-        number_of_valid_rolls = sum(sum(valid_rolls))
+        valid_rolls = (number_of_neighbours < MAX_NEIGHBOURS) * floorplan
+        number_of_valid_rolls = valid_rolls.sum()
         floorplan = floorplan - valid_rolls
-    
-    number_of_rolls_end = sum(sum(floorplan))
-    return number_of_rolls_start - number_of_rolls_end
+    return int(number_of_rolls_start - floorplan.sum())
+
+
+NO_ROLL = -1  # Removal round of an empty cell
+KEPT = 0  # Removal round of a roll that is never accessible
+
+
+@dataclass
+class Peeling:
+    """Round in which every roll is removed, rounds are numbered from 1.
+
+    Attributes:
+        rounds: Array (H, W) with the removal round, NO_ROLL or KEPT
+        remaining: Rolls left after each round, remaining[0] before any
+    """
+
+    rounds: np.ndarray
+    remaining: np.ndarray
+
+    @classmethod
+    def from_rounds(cls, rounds: np.ndarray) -> "Peeling":
+        """Derive the per round counts from a removal round array."""
+        removed = np.bincount(rounds[rounds > KEPT].ravel(), minlength=1)
+        remaining = int((rounds != NO_ROLL).sum()) - np.cumsum(removed)
+        return cls(rounds, remaining)
+
+    @property
+    def removed(self) -> int:
+        """Total number of removed rolls."""
+        return int(self.remaining[0] - self.remaining[-1])
+
+    @property
+    def last_round(self) -> int:
+        """The last round in which rolls were removed."""
+        return len(self.remaining) - 1
+
+    def rolls_after(self, k: int) -> int:
+        """Number of rolls left after round k, k = 0 is the initial count."""
+        return int(self.remaining[min(k, self.last_round)])
+
+    def removed_in(self, k: int) -> int:
+        """Number of rolls removed in round k."""
+        if k < 1 or k > self.last_round:
+            return 0
+        return int(self.remaining[k - 1] - self.remaining[k])
+
+    def round_of(self, y: int, x: int) -> int:
+        """Removal round of a cell, NO_ROLL or KEPT when it is never removed."""
+        return int(self.rounds[y, x])
+
+    def state_after(self, k: int) -> np.ndarray:
+        """Boolean array of the rolls left after round k."""
+        return (self.rounds == KEPT) | (self.rounds > k)
+
+    def save(self, path: str | Path) -> None:
+        """Save the removal rounds as a .npy file."""
+        np.save(path, self.rounds)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Peeling":
+        """Load removal rounds saved with save."""
+        return cls.from_rounds(np.load(path))
+
+
+def peel_rounds(floorplan: np.ndarray) -> Peeling:
+    """Record the round in which every roll is removed, in one incremental pass.
+
+    Neighbour counts are computed once. The rolls of a round are removed
+    together, then only their 8 neighbours are decremented, and a neighbour
+    whose count drops below the limit joins the next round. The total work
+    is proportional to the number of removed rolls, like a k-core peel.
+
+    Args:
+        floorplan: Padded array of rolls
+
+    Returns:
+        The peeling, with rounds for the unpadded grid
+    """
+    width = floorplan.shape[1]
+    offsets = [dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+    rolls = floorplan.ravel().astype(bool)
+    neighbours = count_neighbours(floorplan).ravel().tolist()
+    frontier = np.flatnonzero(rolls & (np.array(neighbours) < MAX_NEIGHBOURS)).tolist()
+    rounds = np.where(rolls, KEPT, NO_ROLL).astype(np.int32)
+    rolls = rolls.tolist()
+
+    current = 0
+    while frontier:
+        current += 1
+        rounds[frontier] = current
+        for cell in frontier:
+            rolls[cell] = False
+        next_frontier = []
+        for cell in frontier:
+            for offset in offsets:
+                neighbour = cell + offset
+                if rolls[neighbour]:
+                    neighbours[neighbour] -= 1
+                    if neighbours[neighbour] == MAX_NEIGHBOURS - 1:
+                        next_frontier.append(neighbour)
+        frontier = next_frontier
+    return Peeling.from_rounds(rounds.reshape(floorplan.shape)[1:-1, 1:-1])
+
+
+def peel_incremental(floorplan: np.ndarray) -> int:
+    """Remove accessible rolls with a work queue of changed cells.
+
+    Args:
+        floorplan: Padded array of rolls
+
+    Returns:
+        Number of removed rolls
+    """
+    return peel_rounds(floorplan).removed
+
+
+def peel_tiled(grid: TiledGrid) -> int:
+    """Remove accessible rolls tile by tile, only revisiting tiles near changes.
+
+    A tile is re-evaluated after it or one of its neighbours lost rolls. The
+    order of removals differs from the round based peel, the final state
+    does not.
+
+    Args:
+        grid: Tiled grid of rolls, modified in place
+
+    Returns:
+        Number of removed rolls
+    """
+    removed = 0
+    active = set(grid.tiles)
+    while active:
+        tile = active.pop()
+        rolls = grid.get_tile(tile)
+        if rolls is None:
+            continue
+        accessible = rolls & (grid.neighbour_counts(tile) < MAX_NEIGHBOURS)
+        if accessible.any():
+            removed += int(accessible.sum())
+            active.update(grid.neighbours(tile))
+            grid.set_tile(tile, rolls & ~accessible)
+    return removed
+
+
+def part1(floorplan: np.ndarray | TiledGrid) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        floorplan: The parsed floorplan, dense or tiled
+
+    Returns:
+        The solution to part 1
+    """
+    if isinstance(floorplan, TiledGrid):
+        return sum(
+            int((floorplan.get_tile(tile) & (floorplan.neighbour_counts(tile) < MAX_NEIGHBOURS)).sum())
+            for tile in floorplan.tiles
+        )
+    valid_rolls = (count_neighbours(floorplan) < MAX_NEIGHBOURS) * floorplan
+    return int(valid_rolls.sum())
+
+def part2(floorplan: np.ndarray | TiledGrid, reference: bool = False) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        floorplan: The parsed floorplan, dense or tiled
+        reference: Use the round based convolution instead of the work queue
+
+    Returns:
+        The solution to part 2
+    """
+    if isinstance(floorplan, TiledGrid):
+        return peel_tiled(floorplan.copy())
+    if reference:
+        return peel_convolution(floorplan)
+    return peel_incremental(floorplan)
 
 def data_loader():
     """Returns a function that load the input data"""
@@ -75,10 +270,10 @@ def data_loader():
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    floorplan = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(floorplan)}")
+    print(f"Part 2: {part2(floorplan)}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
 """Tests for Advent of Code - Day 04"""
 
 import sys
+import tempfile
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+from .solution import (
+    NO_ROLL,
+    Peeling,
+    data_loader,
+    parse,
+    parse_tiled,
+    part1,
+    part2,
+    peel_rounds,
+    peel_tiled,
+)
 
 
 def test_part1():
@@ -11,7 +22,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 13
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +32,66 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 43  # TODO: Update with expected output
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_part2_reference():
+    """Test the convolution reference mode gives the same answer."""
+    test_file = Path(__file__).parent / "test1.txt"
+    data = data_loader()(test_file)
+    floorplan = parse(data)
+    expected = part2(floorplan)
+    result = part2(floorplan, reference=True)
+    assert result == expected, f"Expected {expected}, got {result}"
+    print(f"✓ Part 2 Reference: {result}")
+
+
+def test_tiled():
+    """Test the tiled backend agrees with the dense one across tile borders."""
+    test_file = Path(__file__).parent / "test1.txt"
+    data = data_loader()(test_file)
+    for tile_size in (1, 3, 4, 256):
+        grid = parse_tiled(data, tile_size)
+        assert grid.count() == 71, f"Tile size {tile_size}: got {grid.count()} rolls"
+        assert peel_tiled(grid) == 43, f"Tile size {tile_size}: wrong peel"
+    grid = parse(data.splitlines(), tiled=True)
+    assert part1(grid) == part1(parse(data))
+    assert part2(grid) == part2(parse(data))
+    assert grid.count() == 71, "part2 must not modify the parsed grid"
+    print("✓ Tiled backend")
+
+
+def test_peel_rounds():
+    """Test the removal rounds answer per round queries and survive a save."""
+    test_file = Path(__file__).parent / "test1.txt"
+    peeling = peel_rounds(parse(data_loader()(test_file)))
+    assert peeling.removed == 43, f"Expected 43, got {peeling.removed}"
+    assert peeling.rolls_after(0) == 71
+    assert peeling.removed_in(1) == 13, f"Expected 13, got {peeling.removed_in(1)}"
+    assert peeling.rolls_after(1) == 71 - 13
+    assert peeling.rolls_after(peeling.last_round + 5) == 71 - 43
+    assert int(peeling.state_after(2).sum()) == peeling.rolls_after(2)
+    assert peeling.round_of(0, 0) == NO_ROLL and peeling.round_of(0, 2) == 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "rounds.npy"
+        peeling.save(path)
+        loaded = Peeling.load(path)
+    assert (loaded.rounds == peeling.rounds).all()
+    assert (loaded.remaining == peeling.remaining).all()
+    print(f"✓ Peel Rounds: {peeling.last_round} rounds")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Part 2 Reference", test_part2_reference),
+        ("Tiled backend", test_tiled),
+        ("Peel Rounds", test_peel_rounds),
     ]
 
     print("Running tests...\n")
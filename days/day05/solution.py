@@ -1,92 +1,184 @@
 """Advent of Code - Day 05 Solution"""
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 import numpy as np
 from pathlib import Path
 
-from utils import read_input, read_input_lines
+from utils import cached_parse, read_input, read_input_lines
 
 READ_LINES = True  # Set to False to use read_input
 
-def part1(data: list[str]) -> int:
-    """Solve part 1 of the puzzle.
+
+class IntervalSet:
+    """Set of integers stored as sorted, disjoint, inclusive intervals."""
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray):
+        """Merge possibly overlapping ranges with a single sort and sweep.
+
+        Args:
+            lower: Inclusive lower bounds
+            upper: Inclusive upper bounds
+        """
+        order = np.argsort(lower, kind="stable")
+        lower = np.asarray(lower, dtype=np.int64)[order]
+        upper = np.asarray(upper, dtype=np.int64)[order]
+        if len(lower) == 0:
+            self.lower = self.upper = np.zeros(0, dtype=np.int64)
+            return
+
+        # A range starts a new interval when it begins after everything before it ends
+        reach = np.maximum.accumulate(upper)
+        starts = np.flatnonzero(np.concatenate(([True], lower[1:] > reach[:-1] + 1)))
+        ends = np.append(starts[1:], len(lower)) - 1
+        self.lower = lower[starts]
+        self.upper = reach[ends]
+
+    @property
+    def size(self) -> int:
+        """Number of integers covered by the set."""
+        return int((self.upper - self.lower + 1).sum())  # +1 want inclusive
+
+    def contains_many(self, ids: np.ndarray) -> np.ndarray:
+        """Test membership of many IDs with a binary search over the bounds.
+
+        Args:
+            ids: Array of IDs
+
+        Returns:
+            Boolean array, True where the ID lies in one of the intervals
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(self.lower) == 0:
+            return np.zeros(ids.shape, dtype=bool)
+        index = np.searchsorted(self.lower, ids, side="right") - 1
+        return (index >= 0) & (ids <= self.upper[np.maximum(index, 0)])
+
+
+class IntervalIndex:
+    """Sorted, disjoint, inclusive intervals that accept ranges one at a time.
+
+    Ranges are coalesced on insert with a binary search on both bounds, and
+    the number of covered integers is kept up to date, so queries never
+    need a re-merge.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self.lower: list[int] = []
+        self.upper: list[int] = []
+        self.size = 0
+        self._arrays: tuple[np.ndarray, np.ndarray] | None = None
+
+    def insert(self, lower: int, upper: int) -> None:
+        """Add an inclusive range, merging it with overlapping or adjacent intervals.
+
+        Args:
+            lower: Inclusive lower bound
+            upper: Inclusive upper bound
+        """
+        # Intervals first..last-1 overlap or touch the new range
+        first = bisect_left(self.upper, lower - 1)
+        last = bisect_right(self.lower, upper + 1)
+        if first < last:
+            lower = min(lower, self.lower[first])
+            upper = max(upper, self.upper[last - 1])
+            self.size -= sum(self.upper[first:last]) - sum(self.lower[first:last]) + (last - first)
+        self.lower[first:last] = [lower]
+        self.upper[first:last] = [upper]
+        self.size += upper - lower + 1
+        self._arrays = None
+
+    def contains(self, ingredient_id: int) -> bool:
+        """Test if an ID lies in one of the intervals."""
+        index = bisect_right(self.lower, ingredient_id) - 1
+        return index >= 0 and ingredient_id <= self.upper[index]
+
+    def contains_many(self, ids: np.ndarray) -> np.ndarray:
+        """Test membership of many IDs with a binary search over the bounds.
+
+        Args:
+            ids: Array of IDs
+
+        Returns:
+            Boolean array, True where the ID lies in one of the intervals
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if not self.lower:
+            return np.zeros(ids.shape, dtype=bool)
+        if self._arrays is None:
+            self._arrays = (np.array(self.lower, dtype=np.int64), np.array(self.upper, dtype=np.int64))
+        lower, upper = self._arrays
+        index = np.searchsorted(lower, ids, side="right") - 1
+        return (index >= 0) & (ids <= upper[np.maximum(index, 0)])
+
+
+def scan_feed(lines: Iterable[str], index: IntervalIndex | None = None) -> tuple[IntervalIndex, int]:
+    """Consume a feed of ranges and IDs in arrival order.
+
+    Each ID is checked against the ranges seen so far.
 
     Args:
-        data: The puzzle input as a string
+        lines: Lines with either a range "a-b" or an ID, blank lines are skipped
+        index: Index to extend, a new one by default
 
     Returns:
-        The solution to part 1
+        The index and the number of fresh IDs in the feed
+    """
+    index = IntervalIndex() if index is None else index
+    fresh = 0
+    for line in lines:
+        if "-" in line:
+            lower, upper = line.split("-")
+            index.insert(int(lower), int(upper))
+        elif line:
+            fresh += index.contains(int(line))
+    return index, fresh
+
+
+@cached_parse
+def parse(data: list[str]) -> tuple[IntervalSet, np.ndarray]:
+    """Parse the fresh ranges and the available ingredient IDs.
+
+    Args:
+        data: The puzzle input as a list of lines
+
+    Returns:
+        The merged fresh ranges and the read-only array of ingredient IDs
     """
     _empty_line_index = data.index("")
     ranges = data[:_empty_line_index]
     ingredient_ids = data[_empty_line_index + 1:]
 
-    [lower_range, upper_range] = np.array([r.split('-') for r in ranges]).astype(int).T
-    ingredient_ids = np.array(ingredient_ids).astype(int)
-    
-    number_of_ids = ingredient_ids.shape[0]
-    number_of_ranges = lower_range.shape[0]
-    ingredient_id_matrix = np.tile(ingredient_ids, (1,number_of_ranges)).reshape((number_of_ranges, number_of_ids)).T
+    bounds = np.array([r.split('-') for r in ranges]).astype(np.int64).reshape(-1, 2)
+    ingredient_ids = np.array(ingredient_ids).astype(np.int64)
+    return IntervalSet(bounds[:, 0], bounds[:, 1]), ingredient_ids
 
-    ingredients_greater_than_lower = ingredient_id_matrix >= lower_range
-    ingredients_lower_than_upper = ingredient_id_matrix <= upper_range
-    ingredients_in_range = np.any(ingredients_greater_than_lower & ingredients_lower_than_upper, axis = 1)
 
-    return sum(ingredients_in_range)
+def part1(database: tuple[IntervalSet, np.ndarray]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        database: The parsed fresh ranges and ingredient IDs
 
+    Returns:
+        The solution to part 1
+    """
+    fresh, ingredient_ids = database
+    return int(fresh.contains_many(ingredient_ids).sum())
 
-def part2(data: list[str]) -> int:
+
+def part2(database: tuple[IntervalSet, np.ndarray]) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        database: The parsed fresh ranges and ingredient IDs
 
     Returns:
         The solution to part 2
     """
-    def should_merge_range(new_range, existing_range):
-        [new_lower, new_upper] = new_range
-        [lower, upper] = existing_range
-
-        if new_lower >= lower and new_lower <= upper:
-            # Merge ranges
-            return True
-        if new_upper >= lower and new_upper <= upper:
-            # Merge ranges
-            return True
-
-        return False 
+    fresh, _ = database
+    return fresh.size
 
-    
-    def merge_ranges(range_1, range_2):
-        return [min(range_1[0],range_2[0]), max(range_1[1],range_2[1])]
-
-    _empty_line_index = data.index("")
-    ranges = np.array([r.split('-') for r in data[:_empty_line_index]]).astype(int).tolist()
-    
-    all_checked = False
-    while not all_checked:
-        restart = False
-        for i, input_range in enumerate(ranges):
-            other_ranges = ranges[:i] + ranges[i+1:]
-            for j,check_range in enumerate(other_ranges):
-                if should_merge_range(input_range, check_range):
-                    new_range = merge_ranges(input_range, check_range)
-                    merged_ranges = other_ranges[:j] + [new_range] + other_ranges[j+1:]
-                    restart = True
-                    break
-
-            if restart:
-                break
-        if restart:
-            ranges = merged_ranges
-        else:
-            all_checked = True
-    return sum([end-start+1 for [start, end] in ranges]) # +1 want inclusive
-
-                
-                
-
-
-    
 
 def data_loader():
     """Returns a function that load the input data"""
@@ -97,10 +189,10 @@ def data_loader():
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    database = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(database)}")
+    print(f"Part 2: {part2(database)}")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@
 import sys
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+import numpy as np
+
+from .solution import parse, part1, part2, data_loader, IntervalIndex, IntervalSet, scan_feed
 
 
 def test_part1():
@@ -11,7 +13,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 3
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +23,54 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 14  # TODO: Update with expected output
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_interval_set():
+    """Test merging nested, touching and disjoint ranges."""
+    intervals = IntervalSet(np.array([10, 1, 12, 4, 30]), np.array([20, 3, 15, 4, 31]))
+    assert intervals.lower.tolist() == [1, 10, 30]
+    assert intervals.upper.tolist() == [4, 20, 31]
+    assert intervals.size == 17
+    result = intervals.contains_many(np.array([0, 1, 5, 20, 21, 31, 32]))
+    assert result.tolist() == [False, True, False, True, False, True, False]
+
+    empty = IntervalSet(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    assert empty.size == 0
+    assert empty.contains_many(np.array([0, 5])).tolist() == [False, False]
+    assert part1(parse(["", "3", "7"])) == 0
+    print(f"✓ Interval set: {intervals.size}")
+
+
+def test_interval_index():
+    """Test online inserts keep the intervals merged and the size current."""
+    index = IntervalIndex()
+    for (lower, upper), size in zip([(10, 20), (1, 3), (12, 15), (4, 4), (30, 31)], [11, 14, 14, 15, 17]):
+        index.insert(lower, upper)
+        assert index.size == size, f"Expected {size}, got {index.size}"
+    assert index.lower == [1, 10, 30] and index.upper == [4, 20, 31]
+    assert index.contains(20) and not index.contains(21)
+    result = index.contains_many(np.array([0, 1, 5, 20, 21, 31, 32]))
+    assert result.tolist() == [False, True, False, True, False, True, False]
+    index.insert(5, 29)
+    assert index.lower == [1] and index.upper == [31] and index.size == 31
+
+    test_file = Path(__file__).parent / "test1.txt"
+    data = data_loader()(test_file)
+    index, fresh = scan_feed(data)
+    assert (fresh, index.size) == (part1(parse(data)), part2(parse(data)))
+    print(f"✓ Interval index: {index.size}")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Interval set", test_interval_set),
+        ("Interval index", test_interval_index),
     ]
 
     print("Running tests...\n")
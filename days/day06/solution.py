@@ -1,62 +1,200 @@
 """Advent of Code - Day 06 Solution"""
 
+from collections import Counter
+from dataclasses import dataclass
+from math import prod
 from pathlib import Path
 import numpy as np
-import re
-from itertools import groupby
 
-from utils import read_input, read_input_lines
+from utils import add_counts, cached_parse, parallel_map, read_input, read_input_lines
 
 READ_LINES = True  # Set to False to use read_input
+PARALLEL_PROBLEMS = 1000  # Recompute problems on the process pool from this many
+BAND_CELLS = 1 << 18  # Cells per band of problems read at once
 
-def part1(data: list[str]) -> int:
-    """Solve part 1 of the puzzle.
+
+@dataclass(frozen=True)
+class Worksheet:
+    """Both readings of a worksheet.
+
+    Numbers are int64, or Python ints in object arrays when one of them
+    has more than 18 digits.
+
+    Attributes:
+        operators: Operator byte per problem
+        row_numbers: Array (problems, rows) with the numbers read row-wise
+        column_numbers: Numbers read column-wise, grouped by problem
+        column_starts: Index of the first column number of every problem
+    """
+
+    operators: np.ndarray
+    row_numbers: np.ndarray
+    column_numbers: np.ndarray
+    column_starts: np.ndarray
+
+
+def read_band(digits: np.ndarray, starts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Read the numbers of a band of whole problems both ways.
+
+    Digits are turned into numbers with powers of ten weighted by how many
+    digits follow them, along the row for the row-wise reading and down the
+    column for the column-wise reading.
 
     Args:
-        data: The puzzle input as a string
+        digits: uint8 matrix (rows, columns) of the band without the operator row
+        starts: First column of every problem, relative to the band
 
     Returns:
-        The solution to part 1
+        Array (problems, rows) of row-wise numbers and the column-wise number
+        of every column, int64 or object arrays of Python ints when a number
+        has more than 18 digits
     """
-    input_matrix = np.array([re.split(r'\s+', line.strip()) for line in data])
-    numbers, operator = input_matrix[:-1].astype(int).T, input_matrix[-1].T
+    width = digits.shape[1]
+    is_digit = (digits >= ord("0")) & (digits <= ord("9"))
 
-    product_matrix = numbers[operator == "*"]
-    sum_matrix = numbers[operator == "+"]
+    # Column-wise: exponent is the number of digits below in the same column
+    below = np.cumsum(is_digit[::-1], axis=0, dtype=np.int64)[::-1] - 1
 
-    return sum(np.prod(product_matrix, axis=1)) + sum(np.sum(sum_matrix, axis=1))
+    # Row-wise: exponent is the number of digits right of it within the problem
+    problem = np.cumsum(np.isin(np.arange(width), starts)) - 1
+    ends = np.append(starts[1:], width) - 1
+    seen = np.cumsum(is_digit, axis=1, dtype=np.int64)
+    right = seen[:, ends][:, np.maximum(problem, 0)] - seen
 
+    # Numbers of 19 digits or more may not fit in int64, read those bands as Python ints
+    longest = max(below[is_digit].max(initial=0), right[is_digit].max(initial=0)) + 1
+    dtype = np.int64 if longest <= 18 else object
+    values = np.where(is_digit, digits - ord("0"), 0).astype(dtype)
+    column_numbers = (values * 10 ** np.maximum(below, 0).astype(dtype)).sum(axis=0)
+    row_numbers = np.add.reduceat(values * 10 ** right.astype(dtype), starts, axis=1).T
+    return row_numbers, column_numbers
 
 
-def part2(data: list[str]) -> int:
-    """Solve part 2 of the puzzle.
+@cached_parse
+def parse(data: list[str]) -> Worksheet:
+    """Parse the worksheet as a uint8 matrix, reading it in bands of problems.
+
+    Problems are runs of columns separated by all-space columns. The int64
+    temporaries of read_band only ever cover one band of about BAND_CELLS
+    cells, so peak memory stays a small multiple of the input size.
 
     Args:
-        data: The puzzle input as a string
+        data: The puzzle input as a list of lines
 
     Returns:
-        The solution to part 2
+        The parsed worksheet
+    """
+    width = max(len(line) for line in data)
+    matrix = np.full((len(data), width), ord(" "), dtype=np.uint8)
+    used = np.zeros(width, dtype=bool)
+    for row, line in zip(matrix, data):
+        row[:len(line)] = np.frombuffer(line.encode(), dtype=np.uint8)
+        used |= row != ord(" ")
+    digits, operator_row = matrix[:-1], matrix[-1]
+
+    problem_starts = np.flatnonzero(used & ~np.concatenate(([False], used[:-1])))
+    used_columns = np.flatnonzero(used)
+    row_numbers = np.zeros((len(problem_starts), len(digits)), dtype=np.int64)
+    column_numbers = np.zeros(len(used_columns), dtype=np.int64)
+
+    # Bands start at problem starts, about BAND_CELLS cells apart
+    band_columns = max(1, BAND_CELLS // max(len(digits), 1))
+    band_problems = np.unique(np.searchsorted(problem_starts, np.arange(0, width, band_columns)))
+    band_problems = np.append(band_problems[band_problems < len(problem_starts)], len(problem_starts))
+    for first, last in zip(band_problems[:-1], band_problems[1:]):
+        start = problem_starts[first]
+        end = problem_starts[last] if last < len(problem_starts) else width
+        band_rows, band_columns_numbers = read_band(digits[:, start:end], problem_starts[first:last] - start)
+        if band_rows.dtype != row_numbers.dtype:
+            row_numbers, column_numbers = row_numbers.astype(object), column_numbers.astype(object)
+        row_numbers[first:last] = band_rows
+        used_first, used_last = np.searchsorted(used_columns, [start, end])
+        column_numbers[used_first:used_last] = band_columns_numbers[used_columns[used_first:used_last] - start]
+
+    return Worksheet(
+        operators=operator_row[problem_starts],
+        row_numbers=row_numbers,
+        column_numbers=column_numbers,
+        column_starts=np.searchsorted(used_columns, problem_starts),
+    )
+
+
+def exact_result(problem: tuple[bool, list[int]]) -> int:
+    """Multiply or add the numbers of one problem with Python ints."""
+    is_product, numbers = problem
+    return prod(numbers) if is_product else sum(numbers)
+
+
+def evaluate(numbers: np.ndarray, starts: np.ndarray, operators: np.ndarray) -> tuple[int, Counter]:
+    """Sum the results of all problems without silent int64 overflow.
+
+    Before reducing, every problem is bounded: a product of numbers below
+    2**bits is below 2**sum(bits), and a sum is below count * max. Problems
+    that fit in int64 are reduced together with reduceat, the rest are
+    recomputed exactly with Python ints, in parallel when there are many.
+
+    Args:
+        numbers: Non-negative numbers of all problems, grouped by problem
+        starts: Index of the first number of every problem
+        operators: Operator byte per problem
+
+    Returns:
+        The grand total and a Counter of how many problems took the
+        ``"int64"`` and ``"exact"`` paths
     """
-    number_input_matrix = np.array([list(line) for line in data[:-1]])
-    operators = np.array(re.split(r"\s+", data[-1].rstrip()))
+    limit = np.iinfo(np.int64).max
+    is_product = operators == ord("*")
+    counts = np.diff(np.append(starts, len(numbers)))
 
-    new_input_str = np.rot90(number_input_matrix)
-    new_numbers_strings = np.array(["".join(input_list).strip() for input_list in new_input_str])
+    bits = np.frexp(numbers.astype(np.float64))[1]
+    product_safe = np.add.reduceat(bits, starts) < 63
+    sum_safe = np.maximum.reduceat(numbers, starts) <= limit // np.maximum(counts, 1)
+    safe = np.where(is_product, product_safe, sum_safe)
 
-    numbers = [list(map(int,g)) for k, g in groupby(new_numbers_strings, key=bool) if k]
-    # numbers = new_numbers_strings[new_numbers_strings != ""].reshape(operators.shape[0], -1).astype(int)
-    operators = np.flip(operators)
+    products = np.multiply.reduceat(numbers, starts)
+    sums = np.add.reduceat(numbers, starts)
+    results = np.where(is_product, products, sums)
+    total = int(results[safe].astype(object).sum())
 
-    cumsum = 0
-    for number_list, operator in zip(numbers, operators):
-        if operator == "*":
-            cumsum += np.prod(number_list)
-        elif operator == "+":
-            cumsum += np.sum(number_list)
+    ends = starts + counts
+    unsafe = (
+        (bool(is_product[problem]), numbers[starts[problem]:ends[problem]].tolist())
+        for problem in np.flatnonzero(~safe)
+    )
+    total += sum(parallel_map(exact_result, unsafe, min_items=PARALLEL_PROBLEMS))
 
-    return cumsum
+    paths = Counter({"int64": int(safe.sum()), "exact": int((~safe).sum())})
+    return total, paths
 
-    
+
+def part1(worksheet: Worksheet) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        worksheet: The parsed worksheet
+
+    Returns:
+        The solution to part 1
+    """
+    problems, rows = worksheet.row_numbers.shape
+    starts = np.arange(problems) * rows
+    total, paths = evaluate(worksheet.row_numbers.ravel(), starts, worksheet.operators)
+    add_counts(paths)
+    return total
+
+
+def part2(worksheet: Worksheet) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        worksheet: The parsed worksheet
+
+    Returns:
+        The solution to part 2
+    """
+    total, paths = evaluate(worksheet.column_numbers, worksheet.column_starts, worksheet.operators)
+    add_counts(paths)
+    return total
 
 
 def data_loader():
@@ -68,10 +206,10 @@ def data_loader():
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    worksheet = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(worksheet)}")
+    print(f"Part 2: {part2(worksheet)}")
 
 
 if __name__ == "__main__":
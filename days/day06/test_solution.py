@@ -1,9 +1,14 @@
 """Tests for Advent of Code - Day 06"""
 
 import sys
+from math import prod
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+import numpy as np
+
+from utils import clear_timings, get_timings, set_enabled, span
+from . import solution
+from .solution import parse, part1, part2, data_loader, evaluate
 
 
 def test_part1():
@@ -11,7 +16,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 4277556
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +26,83 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 3263827  # TODO: Update with expected output
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_parse_worksheet():
+    """Test both readings of the worksheet."""
+    test_file = Path(__file__).parent / "test1.txt"
+    worksheet = parse(data_loader()(test_file))
+    assert bytes(worksheet.operators) == b"*+*+"
+    assert worksheet.row_numbers.tolist()[0] == [123, 45, 6]
+    assert worksheet.column_numbers.tolist()[:3] == [1, 24, 356]
+    assert worksheet.column_starts.tolist() == [0, 3, 6, 9]
+
+    # One band per problem gives the same worksheet
+    band_cells, solution.BAND_CELLS = solution.BAND_CELLS, 1
+    try:
+        banded = parse.__wrapped__(data_loader()(test_file))
+    finally:
+        solution.BAND_CELLS = band_cells
+    for name in ("operators", "row_numbers", "column_numbers", "column_starts"):
+        assert np.array_equal(getattr(banded, name), getattr(worksheet, name)), f"{name} differs"
+    print("✓ Parse worksheet")
+
+
+def test_long_numbers():
+    """Test padding beside 18-digit numbers and exact numbers beyond int64."""
+    worksheet = parse([" 123456789012345678", " 1", " *"])
+    assert worksheet.row_numbers.dtype == np.int64
+    assert part1(worksheet) == 123456789012345678
+
+    worksheet = parse([" 12345678901234567890 9", " 2                    9", " +                    *"])
+    assert worksheet.row_numbers.dtype == object
+    assert part1(worksheet) == 12345678901234567890 + 2 + 9 * 9
+    assert part2(worksheet) == 12 + 89 + 99
+
+    tall = parse(["9"] * 20 + ["+"])
+    assert part1(tall) == 180
+    assert part2(tall) == 10**20 - 1
+    print("✓ Long numbers")
+
+
+def test_evaluate_overflow():
+    """Test that products beyond int64 are exact and take the exact path."""
+    numbers = np.array([999999, 888888, 777777, 666666, 2, 3, 4, 5], dtype=np.int64)
+    starts = np.array([0, 4, 6])
+    operators = np.frombuffer(b"**+", dtype=np.uint8)
+    total, paths = evaluate(numbers, starts, operators)
+    expected = prod([999999, 888888, 777777, 666666]) + 6 + 9
+    assert total == expected, f"Expected {expected}, got {total}"
+    assert paths == {"int64": 2, "exact": 1}
+    print(f"✓ Evaluate overflow: {total}")
+
+
+def test_path_counts():
+    """Test that the parts record their evaluation paths on the open span."""
+    test_file = Path(__file__).parent / "test1.txt"
+    worksheet = parse(data_loader()(test_file))
+    set_enabled(True)
+    clear_timings()
+    with span("part1"):
+        part1(worksheet)
+    counters = get_timings()["part1"].counters
+    clear_timings()
+    assert counters == {"int64": 4, "exact": 0}, f"Got {counters}"
+    print(f"✓ Path counts: {dict(counters)}")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Parse worksheet", test_parse_worksheet),
+        ("Long numbers", test_long_numbers),
+        ("Evaluate overflow", test_evaluate_overflow),
+        ("Path counts", test_path_counts),
     ]
 
     print("Running tests...\n")
@@ -1,95 +1,163 @@
 """Advent of Code - Day 07 Solution"""
+from collections.abc import Iterable, Sequence
+from itertools import batched, chain
+
 import numpy as np
 from pathlib import Path
 
-from utils import read_input, read_input_lines
+from utils import stream_lines
+from utils.grid import make_lut, parse_grid
 
-READ_LINES = True  # Set to False to use read_input
+BATCH_ROWS = 1 << 12  # Rows parsed at once when streaming
 
 
-def line_to_splitters(line: str) -> np.array:
-    return np.array([0 if c == "." else 1 for c in line])
+# Byte lookup table with 1 for every non-empty cell
+SPLITTER_LUT = make_lut({".": 0}, default=1)
 
 
+def row_to_bitmask(row: np.ndarray) -> int:
+    """Pack a boolean row into a Python int with bit i set where column i is not empty."""
+    return int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little")
 
-def part1(data: list[str]) -> int:
-    """Solve part 1 of the puzzle.
+
+def parse_rows(rows: Sequence[str]) -> np.ndarray:
+    """Parse equally long rows at once from their raw bytes into a boolean matrix."""
+    return parse_grid(rows, SPLITTER_LUT).view(bool)
+
+
+def parse(raw: Iterable[str]) -> np.ndarray:
+    """Parse the manifold in blocks of rows, so a stream is never held as text.
 
     Args:
-        data: The puzzle input as a string
+        raw: Equally long lines, the first one holds the start
 
     Returns:
-        The solution to part 1
+        Read-only 2-D boolean matrix, True where a cell is not empty
+    """
+    manifold = np.concatenate([parse_rows(rows) for rows in batched(raw, BATCH_ROWS)])
+    manifold.flags.writeable = False
+    return manifold
+
+
+def count_splits(rows: Iterable[np.ndarray]) -> int:
+    """Count the splitters hit by the beams, one row at a time.
+
+    Args:
+        rows: Boolean rows, the first one holds the start
+
+    Returns:
+        Number of splitters hit
     """
-    first_line, data = data[0], data[1:]
+    rows = iter(rows)
+    first_row = next(rows)
 
-    # Initialize beams from first line (1 where there's a non-dot character)
-    beams = np.array([1 if c != "." else 0 for c in first_line])
+    # Beams and splitters are bitsets, so each row is a handful of big-int ops
+    beams = row_to_bitmask(first_row)
+    width_mask = (1 << len(first_row)) - 1
     total_hits = 0
 
-    for line in data:
-        splitters = line_to_splitters(line)
+    for row in rows:
+        splitters = row_to_bitmask(row)
 
         # Count splitters hit by beams
         hit_splitters = beams & splitters
-        total_hits += np.sum(hit_splitters)
+        total_hits += hit_splitters.bit_count()
 
-        # Beams that hit splitters split left and right
-        left_split = np.append(hit_splitters[1:], 0)
-        right_split = np.insert(hit_splitters[:-1], 0, 0)
+        # Beams that hit splitters split left and right, beams that don't
+        # hit splitters continue straight
+        beams = ((hit_splitters >> 1) | (hit_splitters << 1) | (beams & ~splitters)) & width_mask
 
-        # Beams that don't hit splitters continue straight
-        continuing_beams = beams & ~splitters
+    return total_hits
 
-        # Update beams for next layer
-        beams = (left_split | right_split | continuing_beams)
 
-    return total_hits
+def count_routes(rows: Iterable[np.ndarray]) -> int:
+    """Count the routes of a beam through the splitters, one row at a time.
+
+    Args:
+        rows: Boolean rows, the first one holds the start
+
+    Returns:
+        Number of routes
+    """
+    rows = iter(rows)
 
+    # Initialize route counts - 1 route to each starting position
+    route_counts = next(rows).astype(np.int64)
+    next_counts = np.zeros_like(route_counts)
+    hit_counts = np.zeros_like(route_counts)
+    # Every row at most doubles the total, switch to Python ints before int64 can wrap
+    total_routes = int(route_counts.sum())
+
+    for splitter_row in rows:
+        if route_counts.dtype != object and total_routes > np.iinfo(np.int64).max // 2:
+            route_counts, next_counts, hit_counts = (
+                buffer.astype(object) for buffer in (route_counts, next_counts, hit_counts)
+            )
+
+        # Beams that hit splitters split left and right, the rest continue straight
+        np.multiply(route_counts, splitter_row, out=hit_counts)
+        np.subtract(route_counts, hit_counts, out=next_counts)
+        next_counts[:-1] += hit_counts[1:]  # shift left
+        next_counts[1:] += hit_counts[:-1]  # shift right
+        total_routes += int(hit_counts.sum())
+
+        route_counts, next_counts = next_counts, route_counts
+
+    return int(route_counts.sum())
+
+
+def part1(manifold: np.ndarray) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        manifold: The parsed manifold
 
-def part2(data: list[str]) -> int:
+    Returns:
+        The solution to part 1
+    """
+    return count_splits(manifold)
+
+
+def part2(manifold: np.ndarray) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        manifold: The parsed manifold
 
     Returns:
         The solution to part 2
     """
-    first_line, data = data[0], data[1:]
+    return count_routes(manifold)
 
-    # Initialize route counts - 1 route to each starting position
-    route_counts = np.array([1 if c != "." else 0 for c in first_line])
-
-    for line in data:
-        splitters = line_to_splitters(line)
 
-        # Beams that hit splitters split left and right
-        hit_counts = route_counts * splitters
-        left_split = np.append(hit_counts[1:], 0)   # shift left
-        right_split = np.insert(hit_counts[:-1], 0, 0)  # shift right
+def solve_stream(lines: Iterable[str], part: int) -> int:
+    """Solve a part while the rows arrive.
 
-        # Beams that don't hit splitters continue straight
-        continue_counts = route_counts * (1 - splitters)
+    The beams only depend on the row above, so one parsed block of rows is
+    all that is kept.
 
-        # New route counts: sum of splits and continuing beams
-        route_counts = left_split + right_split + continue_counts
+    Args:
+        lines: Equally long lines, the first one holds the start
+        part: The part to solve
 
-    return np.sum(route_counts)
+    Returns:
+        The solution to the part
+    """
+    rows = chain.from_iterable(parse_rows(block) for block in batched(lines, BATCH_ROWS))
+    return count_splits(rows) if part == 1 else count_routes(rows)
 
 def data_loader():
     """Returns a function that load the input data"""
-    if READ_LINES:
-        return read_input_lines
-    return read_input
+    # Rows are parsed block by block, so stream the file
+    return stream_lines
 
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    manifold = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(manifold)}")
+    print(f"Part 2: {part2(manifold)}")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+from .solution import parse, part1, part2, data_loader, row_to_bitmask, solve_stream
 
 
 def test_part1():
@@ -11,7 +11,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 21
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +21,66 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 40
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_part1_wide():
+    """Test a manifold thousands of columns wide."""
+    width = 5000
+    data = ["." * 2500 + "S" + "." * 2499, "." * width, "." * 2500 + "^" + "." * 2499]
+    manifold = parse(data)
+    assert row_to_bitmask(manifold[2]) == 1 << 2500
+    result = part1(manifold)
+    assert result == 1, f"Expected 1, got {result}"
+    print(f"✓ Part 1 Wide: {result}")
+
+
+def test_part2_deep():
+    """Test that route counts beyond int64 are exact."""
+    width = 41
+    data = ["." * 20 + "S" + "." * 20]
+    data += ["".join("^" if (i + j) % 2 else "." for j in range(width)) for i in range(200)]
+
+    # Plain Python ints as reference
+    routes = [int(c != ".") for c in data[0]]
+    for line in data[1:]:
+        next_routes = [0] * width
+        for j, c in enumerate(line):
+            if c == "^":
+                if j > 0:
+                    next_routes[j - 1] += routes[j]
+                if j < width - 1:
+                    next_routes[j + 1] += routes[j]
+            else:
+                next_routes[j] += routes[j]
+        routes = next_routes
+    expected = sum(routes)
+
+    result = part2(parse(data))
+    assert expected > 2**63
+    assert result == expected, f"Expected {expected}, got {result}"
+    print(f"✓ Part 2 Deep: {result}")
+
+
+def test_solve_stream():
+    """Test that the streaming path gives the same answers as the parsed one."""
+    test_file = Path(__file__).parent / "test1.txt"
+    for part, expected in ((1, 21), (2, 40)):
+        result = solve_stream(data_loader()(test_file), part)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ Solve stream: 21, 40")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Part 1 Wide", test_part1_wide),
+        ("Part 2 Deep", test_part2_deep),
+        ("Solve stream", test_solve_stream),
     ]
 
     print("Running tests...\n")
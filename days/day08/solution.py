@@ -1,168 +1,302 @@
 """Advent of Code - Day 08 Solution"""
 
+import heapq
 import numpy as np
 from pathlib import Path
-import re
 
-from collections import defaultdict
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterator
+from itertools import islice
+from scipy.spatial import cKDTree
 
 from typing import Self
 
-from utils import read_input, read_input_lines
+from utils import cached_parse, read_input, read_input_lines
 
 READ_LINES = True  # Set to False to use read_input
 
-@dataclass
-class Point:
-    x: int
-    y: int
-    z: int
+class PointStore:
+    """Junction boxes stored as one (N, 3) int64 array.
+
+    Points are identified by their row index, so no per-point objects are
+    created. Distances are squared integers, which keeps them exact and
+    avoids the square root.
+    """
+
+    def __init__(self, coords: np.ndarray):
+        self.coords = np.ascontiguousarray(coords, dtype=np.int64).reshape(-1, 3)
 
     @classmethod
-    def from_string(cls, s: str) -> Self:
-        point_regex = r"(\d+),(\d+),(\d+)"
-        x, y, z = map(int, re.findall(point_regex, s)[0])
-        return cls(x, y, z)
-    
-    def __str__(self) -> str:
-        return f"Point({self.x}, {self.y}, {self.z})"
-    
-    def __repr__(self) -> str:
-        return self.__str__()
-    
-    def __hash__(self):
-        return f"({self.x}, {self.y}, {self.z})".__hash__()
-    
-    def to_array(self) -> np.array:
-        return np.array([self.x, self.y, self.z])
-    
-    def distance(self, other: Self) -> int:
-        return np.linalg.norm(self.to_array() - other.to_array())
-    
-
-
-
-
-
-def part1(data: list[str], max_connections) -> int:
+    def from_lines(cls, data: list[str]) -> Self:
+        """Parse ``x,y,z`` lines in one pass over the joined text."""
+        text = ",".join(line for line in data if line)
+        return cls(np.array(text.split(",") if text else [], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def squared_distances(self, rows: slice, columns: np.ndarray | slice = slice(None)) -> np.ndarray:
+        """Squared distances between a block of rows and a set of columns.
+
+        Accumulated one coordinate at a time, so the only temporaries have
+        the shape of the result.
+
+        Args:
+            rows: Slice of point indices
+            columns: Point indices or slice to measure against, all points by default
+
+        Returns:
+            Array of shape (len(rows), len(columns))
+        """
+        a, b = self.coords[rows], self.coords[columns]
+        distances = np.zeros((len(a), len(b)), dtype=np.int64)
+        for axis in range(3):
+            diff = a[:, None, axis] - b[None, :, axis]
+            diff *= diff
+            distances += diff
+        return distances
+
+    def neighbour_distances(self, rows: np.ndarray, neighbours: np.ndarray) -> np.ndarray:
+        """Squared distances from every row to its own list of neighbours.
+
+        Args:
+            rows: Point indices, shape (r,)
+            neighbours: Point indices per row, shape (r, m)
+
+        Returns:
+            Array of shape (r, m)
+        """
+        a, b = self.coords[rows], self.coords[neighbours]
+        distances = np.zeros(neighbours.shape, dtype=np.int64)
+        for axis in range(3):
+            diff = b[..., axis] - a[:, None, axis]
+            diff *= diff
+            distances += diff
+        return distances
+
+    def distance_blocks(
+        self, block_rows: int = 1024, block_columns: int = 1024
+    ) -> Iterator[tuple[int, int, np.ndarray]]:
+        """Stream the upper triangle of the distance matrix in tiles.
+
+        Only one tile of ``block_rows`` x ``block_columns`` distances is
+        alive at a time.
+
+        Yields:
+            Tuples (row_start, column_start, block) where block[r, c] is the
+            squared distance between point row_start + r and point
+            column_start + c, and -1 unless row_start + r < column_start + c
+        """
+        n = len(self)
+        for row_start in range(0, n, block_rows):
+            row_stop = min(row_start + block_rows, n)
+            for column_start in range(row_start + 1, n, block_columns):
+                column_stop = min(column_start + block_columns, n)
+                block = self.squared_distances(slice(row_start, row_stop), slice(column_start, column_stop))
+                if column_start < row_stop:
+                    # The tile crosses the diagonal, keep only pairs i < j
+                    rows = np.arange(row_start, row_stop)[:, None]
+                    columns = np.arange(column_start, column_stop)[None, :]
+                    block[rows >= columns] = -1
+                yield row_start, column_start, block
+
+    def closest_pairs(self, k: int, block_rows: int = 1024, block_columns: int = 1024) -> list[tuple[int, int, int]]:
+        """Find the k closest pairs by streaming distance tiles.
+
+        Every tile is cut down to its own k closest pairs before it is
+        merged, so memory is bounded by the tile size and k.
+
+        Args:
+            k: Number of pairs
+            block_rows: Rows per distance tile
+            block_columns: Columns per distance tile
+
+        Returns:
+            Sorted list of (squared distance, i, j) with i < j
+        """
+        best = np.zeros((0, 3), dtype=np.int64)
+        threshold = np.iinfo(np.int64).max
+        for row_start, column_start, block in self.distance_blocks(block_rows, block_columns):
+            rows, columns = np.nonzero((block >= 0) & (block <= threshold))
+            distances = block[rows, columns]
+            if len(distances) > k:
+                keep = np.argpartition(distances, k - 1)[:k]
+                rows, columns, distances = rows[keep], columns[keep], distances[keep]
+            candidates = np.column_stack((distances, row_start + rows, column_start + columns))
+            best = np.concatenate((best, candidates))
+            if len(best) > k:
+                best = best[np.argpartition(best[:, 0], k - 1)[:k]]
+            if len(best) == k:
+                threshold = best[:, 0].max()
+        best = best[np.lexsort((best[:, 2], best[:, 1], best[:, 0]))]
+        return [tuple(edge) for edge in best.tolist()]
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1.
+
+    Keeps a live count of the components and a histogram of their sizes, so
+    connectivity and largest-component queries need no scan over all points.
+    """
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+        self.size_histogram = Counter({1: n}) if n else Counter()
+
+    def find(self, a: int) -> int:
+        """Find the root of a, compressing the path on the way."""
+        root = a
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[a] != root:
+            self.parent[a], a = root, self.parent[a]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Join the sets of a and b, attaching the smaller set to the larger.
+
+        Returns:
+            True if a and b were in different sets
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        size_a, size_b = self.size[root_a], self.size[root_b]
+        for size in (size_a, size_b):
+            self.size_histogram[size] -= 1
+            if not self.size_histogram[size]:
+                del self.size_histogram[size]
+        self.size_histogram[size_a + size_b] += 1
+
+        self.parent[root_b] = root_a
+        self.size[root_a] = size_a + size_b
+        self.components -= 1
+        return True
+
+    def largest(self, k: int) -> list[int]:
+        """Sizes of the k largest components, walking the size histogram."""
+        sizes = []
+        for size in sorted(self.size_histogram, reverse=True):
+            sizes.extend([size] * min(self.size_histogram[size], k - len(sizes)))
+            if len(sizes) == k:
+                break
+        return sizes
+
+
+def nearest_edges(points: PointStore, k: int = 16) -> Iterator[tuple[int, int, int]]:
+    """Generate all pairs of points in ascending distance order.
+
+    Every point keeps a pointer into its own neighbour list from a KD-tree,
+    and a heap holds the next unvisited neighbour of every point. Neighbour
+    lists are fetched lazily and doubled in size when exhausted, so only the
+    pairs that are actually consumed are ever generated.
+
+    Lists are sorted by (exact squared distance, index). The farthest
+    distance of a partial list may be tied with points the tree left out,
+    so only the neighbours strictly closer than it are visited before the
+    list is extended, and the longer list is resumed after the last
+    visited key rather than at the same position.
+
+    Args:
+        points: The junction boxes
+        k: Number of neighbours to fetch per point up front
+
+    Yields:
+        Tuples (squared distance, i, j) with i < j
+    """
+    n = len(points)
+    if n < 2:
+        return
+    tree = cKDTree(points.coords)
+
+    def fetch(rows: np.ndarray, count: int) -> tuple[list, list, list]:
+        """Sorted neighbour lists of rows, their distances and complete prefix lengths."""
+        _, indices = tree.query(points.coords[rows], k=count)
+        indices = indices.reshape(len(rows), count)
+        # Exact integer distances, the tree only decides which points are fetched
+        distances = points.neighbour_distances(rows, indices)
+        order = np.lexsort((indices, distances))
+        sorted_rows = np.arange(len(rows))[:, None]
+        indices, distances = indices[sorted_rows, order], distances[sorted_rows, order]
+        if count == n:
+            complete = np.full(len(rows), n)
+        else:
+            complete = (distances < distances[:, -1:]).sum(axis=1)
+        return indices.tolist(), distances.tolist(), complete.tolist()
+
+    neighbours, distances, complete = fetch(np.arange(n), min(k + 1, n))
+    rank = [0] * n
+
+    def advance(i: int) -> tuple[int, int, int] | None:
+        while True:
+            if rank[i] == complete[i]:
+                count = len(neighbours[i])
+                if count == n:
+                    return None
+                last = (distances[i][rank[i] - 1], neighbours[i][rank[i] - 1]) if rank[i] else None
+                (neighbours[i],), (distances[i],), (complete[i],) = fetch(np.array([i]), min(2 * count, n))
+                if last is not None:
+                    rank[i] = bisect_right(list(zip(distances[i], neighbours[i])), last)
+                continue
+            j = neighbours[i][rank[i]]
+            distance = distances[i][rank[i]]
+            rank[i] += 1
+            if j != i:
+                return (distance, min(i, j), max(i, j))
+
+    heap = [edge + (i,) for i in range(n) if (edge := advance(i))]
+    heapq.heapify(heap)
+    while heap:
+        distance, a, b, i = heapq.heappop(heap)
+        # Every pair is reached from both ends, only emit it from the lower index
+        if i == a:
+            yield distance, a, b
+        if (edge := advance(i)):
+            heapq.heappush(heap, edge + (i,))
+
+
+@cached_parse
+def parse(data: list[str]) -> PointStore:
+    """Parse the junction boxes, shared between both parts."""
+    return PointStore.from_lines(data)
+
+
+def part1(points: PointStore, max_connections: int = 1000) -> int:
     """Solve part 1 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        points: The parsed junction boxes
+        max_connections: Number of closest pairs to connect
 
     Returns:
         The solution to part 1
     """
-    points = [Point.from_string(line) for line in data]
-
-    distance_dict = defaultdict(int)
-
-    for pointA in points:
-        for pointB in points:
-            if pointA != pointB and (pointB, pointA) not in distance_dict.keys():
-                distance_dict[(pointA, pointB)] = pointA.distance(pointB)
-    
-    
-    sorted_by_distance = sorted(distance_dict.items(), key=lambda item:item[1])
-    
-    network_index = {point: net_id for net_id, point in enumerate(points)}
-    active_networks = defaultdict(set)
-    connections_made = 0
-    for ((pointA, pointB), distance) in sorted_by_distance:
-        # Edge case: pointA in network and pointB in other network > Join networks
-        networkA = network_index[pointA]
-        networkB = network_index[pointB]
-        activeA = active_networks[networkA]
-        activeB = active_networks[networkB]
-        # They are in same network => no new connection needed
-        if networkA == networkB:
-            pass # continue so no new connection made
-        # They are both in existing network but not same > merge networks
-        elif activeA and activeB:
-            for point in activeB:
-                network_index[point] = networkA
-            active_networks[networkA].update(set(activeB))
-            del active_networks[networkB]
-        # If B alread connected to others > Add A to B:
-        elif activeB:
-            network_index[pointA] = networkB
-            active_networks[networkB].add(pointA)
-        # If A already connected, or none are connected
-        elif activeA:
-            network_index[pointB] = networkA
-            active_networks[networkA].add(pointB)
-        # If non active > Add B to A, create active network A
-        else:
-            network_index[pointB] = networkA
-            active_networks[networkA].update({pointA, pointB})
-
-        connections_made += 1
-        pass
-        if connections_made == max_connections:
-            return np.prod(sorted([len(net) for _, net in active_networks.items()], reverse=True)[:3])
+    networks = UnionFind(len(points))
+    for _, pointA, pointB in islice(nearest_edges(points), max_connections):
+        networks.union(pointA, pointB)
 
+    return int(np.prod(networks.largest(3)))
 
 
-def part2(data: list[str]) -> int:
+def part2(points: PointStore) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        points: The parsed junction boxes
 
     Returns:
         The solution to part 2
     """
-    points = [Point.from_string(line) for line in data]
-
-    distance_dict = defaultdict(int)
-
-    for pointA in points:
-        for pointB in points:
-            if pointA != pointB and (pointB, pointA) not in distance_dict.keys():
-                distance_dict[(pointA, pointB)] = pointA.distance(pointB)
-    
-    
-    sorted_by_distance = sorted(distance_dict.items(), key=lambda item:item[1])
-    
-    network_index = {point: net_id for net_id, point in enumerate(points)}
-    active_networks = defaultdict(set)
-    for ((pointA, pointB), distance) in sorted_by_distance:
-        # Edge case: pointA in network and pointB in other network > Join networks
-        networkA = network_index[pointA]
-        networkB = network_index[pointB]
-        activeA = active_networks[networkA]
-        activeB = active_networks[networkB]
-        # They are in same network => no new connection needed
-        if networkA == networkB:
-            pass # continue so no new connection made
-        # They are both in existing network but not same > merge networks
-        elif activeA and activeB:
-            for point in activeB:
-                network_index[point] = networkA
-            active_networks[networkA].update(set(activeB))
-            del active_networks[networkB]
-        # If B alread connected to others > Add A to B:
-        elif activeB:
-            network_index[pointA] = networkB
-            active_networks[networkB].add(pointA)
-        # If A already connected, or none are connected
-        elif activeA:
-            network_index[pointB] = networkA
-            active_networks[networkA].add(pointB)
-        # If non active > Add B to A, create active network A
-        else:
-            network_index[pointB] = networkA
-            active_networks[networkA].update({pointA, pointB})
-
-        if len(np.unique(list(network_index.values()))) == 1:
-            return pointA.x * pointB.x
-
-        # Cleanup unused networks.
-        if not activeA:
-            del active_networks[networkA]
-        if not activeB:
-            del active_networks[networkB]
+    networks = UnionFind(len(points))
+    # Kruskal: the edge that joins the last two networks completes the MST
+    for _, pointA, pointB in nearest_edges(points):
+        if networks.union(pointA, pointB) and networks.components == 1:
+            return int(points.coords[pointA, 0] * points.coords[pointB, 0])
 
 
 def data_loader():
@@ -174,10 +308,10 @@ def data_loader():
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    points = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data, max_connections=1000)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(points, max_connections=1000)}")
+    print(f"Part 2: {part2(points)}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 """Tests for Advent of Code - Day 08"""
 
 import sys
+from itertools import islice
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+import numpy as np
+
+from .solution import parse, part1, part2, data_loader, nearest_edges, PointStore, UnionFind
 
 
 def test_part1():
@@ -11,7 +14,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 40  # TODO: Update with expected output
-    result = part1(data, max_connections=10)
+    result = part1(parse(data), max_connections=10)
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,16 +24,72 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 25272  # TODO: Update with expected output
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
 
+def test_nearest_edges():
+    """Test that edges come out in ascending order and cover every pair."""
+    rng = np.random.default_rng(8)
+    points = PointStore(rng.integers(0, 1000, size=(60, 3)))
+    edges = list(nearest_edges(points, k=2))
+    distances = [distance for distance, _, _ in edges]
+    assert distances == sorted(distances)
+    assert sorted((a, b) for _, a, b in edges) == [
+        (a, b) for a in range(60) for b in range(a + 1, 60)
+    ]
+    print(f"✓ Nearest edges: {len(edges)}")
+
+
+def test_nearest_edges_ties():
+    """Test that tied distances yield every pair exactly once."""
+    rng = np.random.default_rng(6)
+    for n, k in [(40, 1), (40, 2), (40, 8), (11, 8), (200, 8)]:
+        points = PointStore(rng.integers(0, 3, size=(n, 3)))
+        edges = list(nearest_edges(points, k=k))
+        distances = [distance for distance, _, _ in edges]
+        assert distances == sorted(distances)
+        assert sorted((a, b) for _, a, b in edges) == [
+            (a, b) for a in range(n) for b in range(a + 1, n)
+        ], f"Wrong pairs for n={n}, k={k}"
+        exact = points.squared_distances(slice(None))
+        assert all(distance == exact[a, b] for distance, a, b in edges)
+    print(f"✓ Nearest edges with ties: {len(edges)}")
+
+
+def test_closest_pairs():
+    """Test the streamed distance blocks against the KD-tree edges."""
+    test_file = Path(__file__).parent / "test1.txt"
+    points = PointStore.from_lines(data_loader()(test_file))
+    expected = list(islice(nearest_edges(points), 30))
+    result = points.closest_pairs(30, block_rows=3, block_columns=5)
+    assert result == expected, f"Expected {expected}, got {result}"
+    print(f"✓ Closest pairs: {len(result)}")
+
+
+def test_union_find():
+    """Test the live component count and size histogram."""
+    networks = UnionFind(6)
+    assert networks.union(0, 1)
+    assert networks.union(2, 3)
+    assert networks.union(1, 3)
+    assert not networks.union(0, 2)
+    assert networks.components == 3
+    assert networks.size_histogram == {4: 1, 1: 2}
+    assert networks.largest(3) == [4, 1, 1]
+    print(f"✓ Union find: {networks.components}")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         ("Part 1 Example 1", test_part1),
         ("Part 2 Example 1", test_part2),
+        ("Nearest edges", test_nearest_edges),
+        ("Nearest edges with ties", test_nearest_edges_ties),
+        ("Closest pairs", test_closest_pairs),
+        ("Union find", test_union_find),
     ]
 
     print("Running tests...\n")
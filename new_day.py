@@ -73,7 +73,7 @@ def create_day(day: int) -> None:
     print(f"  1. Add your puzzle input to {day_dir / 'input.txt'}")
     print(f"  2. Add test inputs to {day_dir / 'test1.txt'} and {day_dir / 'test2.txt'}")
     print(f"  3. Update expected outputs in {day_dir / 'test_solution.py'}")
-    print(f"  4. Implement your solution in {day_dir / 'solution.py'}")
+    print(f"  4. Implement parse, part1 and part2 in {day_dir / 'solution.py'}")
     print(f"\nRun tests: uv run {day_dir / 'test_solution.py'}")
     print(f"Run solution: uv run {day_dir / 'solution.py'}")
 
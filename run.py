@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Script to run and time any selection of days and parts."""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from utils import clear_parse_cache, clear_timings, get_timings, set_enabled, span
+from utils.parallel import pool_context
+
+DAYS_DIR = Path(__file__).parent / "days"
+
+
+def discover_days() -> list[int]:
+    """Find all days with a solution module.
+
+    Returns:
+        Sorted list of day numbers
+    """
+    days = []
+    for solution_file in DAYS_DIR.glob("day*/solution.py"):
+        try:
+            days.append(int(solution_file.parent.name[3:]))
+        except ValueError:
+            continue
+    return sorted(days)
+
+
+def solve_part(module, part: int, model, memory: bool = False):
+    """Run one part on the parsed model inside its span."""
+    with span(f"part{part}", memory=memory):
+        return getattr(module, f"part{part}")(model)
+
+
+def timing_result(day: int, part: int | str, answer, name: str, timings: dict) -> dict:
+    """Build the result dict of a timed span and the spans nested in it."""
+    timing = timings[name]
+    return {
+        "day": day,
+        "part": part,
+        "answer": int(answer) if answer is not None else None,
+        "seconds": timing.median_ns / 1e9,
+        **timing.to_dict(),
+        "spans": [
+            nested.to_dict() for key, nested in timings.items() if key.startswith(f"{name}/") and nested.count
+        ],
+    }
+
+
+def run_day(
+    day: int, parts: list[int], input_name: str, repeat: int = 1, memory: bool = False, threads: bool = False
+) -> list[dict]:
+    """Parse the input of a day once and run the selected parts on it.
+
+    Every run loads the input fresh, so streamed inputs work, and parses it
+    under its own ``parse`` span with the in-process parse cache cleared.
+    The parts then share the parsed model, one after another or in
+    threads. Spans opened inside a stage are reported nested under it.
+    Anything the parts print is captured.
+
+    Args:
+        day: The day number
+        parts: The parts to run
+        input_name: Name of the input file in the day folder
+        repeat: Number of timed runs
+        memory: Also record the peak traced memory, which parts running in
+            threads share
+        threads: Run the parts in parallel threads
+
+    Returns:
+        One result dict for the parse and one per part with day, part,
+        answer, timing statistics and the nested spans
+    """
+    module = importlib.import_module(f"days.day{day:02d}.solution")
+    input_file = DAYS_DIR / f"day{day:02d}" / input_name
+    load = module.data_loader()
+    set_enabled(True)
+    clear_timings()
+
+    answers = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            data = load(input_file)
+            clear_parse_cache()
+            with span("parse", memory=memory):
+                model = module.parse(data)
+            del data
+            if threads and len(parts) > 1:
+                with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+                    futures = {part: executor.submit(solve_part, module, part, model, memory) for part in parts}
+                    answers = {part: future.result() for part, future in futures.items()}
+            else:
+                answers = {part: solve_part(module, part, model, memory) for part in parts}
+
+    timings = get_timings()
+    results = [timing_result(day, "parse", None, "parse", timings)]
+    results += [timing_result(day, part, answers[part], f"part{part}", timings) for part in parts]
+    return results
+
+
+def print_table(results: list[dict]) -> None:
+    """Print the results as a timing table."""
+    header = f"{'Day':>3}  {'Part':>5}  {'Answer':>20}  {'Median (ms)':>11}  {'Min (ms)':>10}  {'P95 (ms)':>10}  {'Peak (KiB)':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        answer = str(result["answer"]) if result["answer"] is not None else "-"
+        rows = [(f"{result['day']:>3}  {result['part']:>5}  {answer:>20}", result)]
+        rows += [(f"{'':>10}  {nested['name']:>20}", nested) for nested in result["spans"]]
+        for label, timing in rows:
+            peak = f"{timing['peak_bytes'] / 1024:.1f}" if timing["peak_bytes"] is not None else "-"
+            print(
+                f"{label}  {timing['median_ns'] / 1e6:>11.3f}  {timing['min_ns'] / 1e6:>10.3f}  "
+                f"{timing['p95_ns'] / 1e6:>10.3f}  {peak:>10}"
+            )
+            if timing["counters"]:
+                counts = ", ".join(f"{name}={count}" for name, count in timing["counters"].items())
+                print(f"{'':>34}{counts}")
+    print("-" * len(header))
+    total = sum(result["seconds"] for result in results)
+    print(f"{'Total':<32}  {total * 1000:>11.3f}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run and time Advent of Code solutions")
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        help="Day numbers to run. If not provided, runs all days.",
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, choices=[1, 2], action="append", help="Part to run, can be repeated"
+    )
+    parser.add_argument("-i", "--input", default="input.txt", help="Input file name in each day folder")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Run days in parallel over this many processes (0 for all cores)"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Number of timed runs per day")
+    parser.add_argument(
+        "-t", "--threads", action="store_true", help="Run the parts of a day in parallel threads on the shared parse"
+    )
+    parser.add_argument("-m", "--memory", action="store_true", help="Record peak memory with tracemalloc")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+    args = parser.parse_args()
+
+    available = discover_days()
+    days = args.days or available
+    missing = sorted(set(days) - set(available))
+    if missing:
+        print(f"Error: No solution for day(s) {', '.join(map(str, missing))}")
+        sys.exit(1)
+    parts = args.part or [1, 2]
+
+    if args.jobs == 1:
+        day_results = [run_day(day, parts, args.input, args.repeat, args.memory, args.threads) for day in days]
+    else:
+        # Workers run parallel_map serially, see default_workers
+        with ProcessPoolExecutor(max_workers=args.jobs or None, mp_context=pool_context()) as executor:
+            futures = [
+                executor.submit(run_day, day, parts, args.input, args.repeat, args.memory, args.threads)
+                for day in days
+            ]
+            day_results = [future.result() for future in futures]
+    results = [result for day_result in day_results for result in day_result]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
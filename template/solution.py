@@ -1,16 +1,45 @@
 """Advent of Code - Day XX Solution"""
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
-from utils import read_input, read_input_lines
+from utils import read_input, read_input_lines, stream_lines
 
 READ_LINES = True  # Set to False to use read_input
+STREAM = False  # Set to True to pass a lazy line iterator to parse
 
-def part1(data: list[str]) -> int:
+
+@dataclass(frozen=True)
+class Model:
+    """The parsed puzzle input, shared by both parts and never modified.
+
+    Attributes:
+        lines: The input lines
+    """
+
+    # TODO: Replace with the fields the parts need
+    lines: tuple[str, ...]
+
+
+def parse(raw: Iterable[str]) -> Model:
+    """Parse the puzzle input once for both parts.
+
+    Args:
+        raw: The puzzle input as returned by data_loader
+
+    Returns:
+        The model passed to part1 and part2
+    """
+    # TODO: Implement parsing
+    return Model(tuple(raw))
+
+
+def part1(model: Model) -> int:
     """Solve part 1 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        model: The parsed puzzle input
 
     Returns:
         The solution to part 1
@@ -19,11 +48,11 @@ def part1(data: list[str]) -> int:
     return 0
 
 
-def part2(data: list[str]) -> int:
+def part2(model: Model) -> int:
     """Solve part 2 of the puzzle.
 
     Args:
-        data: The puzzle input as a string
+        model: The parsed puzzle input
 
     Returns:
         The solution to part 2
@@ -33,6 +62,8 @@ def part2(data: list[str]) -> int:
 
 def data_loader():
     """Returns a function that load the input data"""
+    if STREAM:
+        return stream_lines
     if READ_LINES:
         return read_input_lines
     return read_input
@@ -40,10 +71,10 @@ def data_loader():
 def main():
     """Run the solution on the actual input."""
     input_file = Path(__file__).parent / "input.txt"
-    data = data_loader()(input_file)
+    model = parse(data_loader()(input_file))
 
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    print(f"Part 1: {part1(model)}")
+    print(f"Part 2: {part2(model)}")
 
 
 if __name__ == "__main__":
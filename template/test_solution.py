@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from .solution import part1, part2, data_loader
+from .solution import parse, part1, part2, data_loader
 
 
 def test_part1():
@@ -11,7 +11,7 @@ def test_part1():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 0  # TODO: Update with expected output
-    result = part1(data)
+    result = part1(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 1 Example 1: {result}")
 
@@ -21,7 +21,7 @@ def test_part2():
     test_file = Path(__file__).parent / "test1.txt"
     data = data_loader()(test_file)
     expected = 0  # TODO: Update with expected output
-    result = part2(data)
+    result = part2(parse(data))
     assert result == expected, f"Expected {expected}, got {result}"
     print(f"✓ Part 2 Example 1: {result}")
 
@@ -0,0 +1,44 @@
+"""Tests for the runner."""
+
+import pytest
+
+from run import discover_days, print_table, run_day
+
+
+def test_discover_days():
+    """Test that the solved days are found in order."""
+    days = discover_days()
+    assert days == sorted(days)
+    assert 4 in days
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_run_day(threads):
+    """Test the parse row and the part answers on the example input."""
+    results = run_day(4, [1, 2], "test1.txt", repeat=2, threads=threads)
+    assert [result["part"] for result in results] == ["parse", 1, 2]
+    assert [result["answer"] for result in results] == [None, 13, 43]
+    for result in results:
+        assert result["day"] == 4
+        assert result["count"] == 2
+        assert result["min_ns"] <= result["median_ns"] <= result["p95_ns"]
+        assert result["peak_bytes"] is None
+
+
+def test_run_day_memory_and_counters():
+    """Test peak memory and the counters the parts record."""
+    results = run_day(6, [2], "test1.txt", memory=True)
+    assert [result["part"] for result in results] == ["parse", 2]
+    assert all(result["peak_bytes"] > 0 for result in results)
+    assert results[1]["counters"]
+
+
+def test_print_table(capsys):
+    """Test that every result gets a row and the total is printed."""
+    print_table(run_day(4, [1], "test1.txt"))
+    lines = capsys.readouterr().out.splitlines()
+    assert "Answer" in lines[0]
+    rows = [line.split()[:3] for line in lines]
+    assert rows[2] == ["4", "parse", "-"]
+    assert ["4", "1", "13"] in rows
+    assert lines[-1].startswith("Total")
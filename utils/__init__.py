@@ -1,3 +1,21 @@
-from .input_handler import read_input, read_input_lines
-from .decoratos import timeit
-__all__ = ["read_input", "read_input_lines", "timeit"]
+from .input_handler import read_input, read_input_lines, stream_lines, stream_batches, MappedInput
+from .decoratos import timeit, span, add_counts, get_timings, clear_timings, set_enabled, timing_report
+from .cache import cached_parse, clear_parse_cache
+from .parallel import parallel_map
+__all__ = [
+    "read_input",
+    "read_input_lines",
+    "stream_lines",
+    "stream_batches",
+    "MappedInput",
+    "timeit",
+    "span",
+    "add_counts",
+    "get_timings",
+    "clear_timings",
+    "set_enabled",
+    "timing_report",
+    "cached_parse",
+    "clear_parse_cache",
+    "parallel_map",
+]
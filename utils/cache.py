@@ -0,0 +1,167 @@
+"""Cache parsed puzzle inputs in memory and on disk."""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+
+from .decoratos import span
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", Path(__file__).parent.parent / ".cache"))
+
+_memory: dict[str, object] = {}
+
+
+def _content_hash(data) -> str | None:
+    """Hash raw puzzle input, or None if it cannot be hashed without consuming it."""
+    if isinstance(data, str):
+        payload = b"str\0" + data.encode()
+    elif isinstance(data, list) and all(isinstance(line, str) for line in data):
+        payload = b"lines\0" + "\n".join(data).encode()
+    else:
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _source_hash(module) -> str:
+    """Hash the source of a module and of the ``utils`` modules it uses, transitively.
+
+    A parser calling into a shared helper, like ``utils.grid.parse_grid``,
+    gets a new key when the helper changes.
+    """
+    modules, pending = {}, [module]
+    while pending:
+        current = pending.pop()
+        if current.__name__ in modules:
+            continue
+        modules[current.__name__] = current
+        for value in vars(current).values():
+            name = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+            if isinstance(name, str) and (name == __package__ or name.startswith(f"{__package__}.")):
+                if name in sys.modules:
+                    pending.append(sys.modules[name])
+
+    digest = hashlib.sha256()
+    for name in sorted(modules):
+        try:
+            digest.update(inspect.getsource(modules[name]).encode())
+        except (OSError, TypeError):
+            # Packages without an __init__ source
+            digest.update(name.encode())
+    return digest.hexdigest()
+
+
+def _save(path: Path, parsed) -> None:
+    """Store arrays as .npz and anything else as a pickle, atomically."""
+    tmp = path.with_name(path.name + ".tmp")
+    if isinstance(parsed, np.ndarray) and parsed.dtype != object:
+        with open(tmp, "wb") as f:
+            np.savez(f, array=parsed)
+    else:
+        with open(tmp, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _find(key: str) -> Path | None:
+    """Find the cached parse on disk, if any."""
+    for suffix in (".npz", ".pkl"):
+        path = CACHE_DIR / f"{key}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _load(path: Path):
+    """Load a cached parse from disk."""
+    if path.suffix == ".npz":
+        with np.load(path) as stored:
+            return stored["array"]
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _freeze(parsed) -> None:
+    """Make the arrays in a parse result read-only, nested in tuples, lists or objects."""
+    if isinstance(parsed, np.ndarray):
+        parsed.flags.writeable = False
+    elif isinstance(parsed, (tuple, list)):
+        for item in parsed:
+            _freeze(item)
+    elif hasattr(parsed, "__dict__"):
+        for value in vars(parsed).values():
+            _freeze(value)
+
+
+def clear_parse_cache() -> None:
+    """Drop all in-process entries, the disk cache is left alone."""
+    _memory.clear()
+
+
+def cached_parse(parse):
+    """Decorator to memoise a day's ``parse(data)`` function.
+
+    Results are kept in-process and on disk under ``CACHE_DIR``, keyed by
+    the hash of the raw input and of the source of the parser's module and
+    the ``utils`` modules it uses, so editing the day or a shared helper
+    invalidates its cache. Inputs that are streamed are parsed
+    directly. Callers share the cached object, so its arrays are made
+    read-only.
+
+    Set ``AOC_CACHE_DIR`` to move the disk cache, or ``AOC_PARSE_CACHE=0``
+    to only memoise in-process.
+
+    Example:
+        @cached_parse
+        def parse(data: str) -> np.ndarray:
+            ...
+    """
+    name = f"{parse.__module__}.{parse.__qualname__}"
+    parser_hash = None
+
+    @wraps(parse)
+    def wrapper(data):
+        nonlocal parser_hash
+        content_hash = _content_hash(data)
+        if content_hash is None:
+            with span("parse"):
+                parsed = parse(data)
+            _freeze(parsed)
+            return parsed
+        if parser_hash is None:
+            # Hashed on first use, once the module has finished importing
+            parser_hash = _source_hash(inspect.getmodule(parse))
+        key = f"{name}-{hashlib.sha256((parser_hash + content_hash).encode()).hexdigest()[:32]}"
+
+        if key in _memory:
+            return _memory[key]
+        use_disk = os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+        path = _find(key) if use_disk else None
+        try:
+            if path is None:
+                raise KeyError(key)
+            with span("load"):
+                parsed = _load(path)
+        except (KeyError, OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+            with span("parse"):
+                parsed = parse(data)
+            if use_disk:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                is_array = isinstance(parsed, np.ndarray) and parsed.dtype != object
+                _save(CACHE_DIR / f"{key}.{'npz' if is_array else 'pkl'}", parsed)
+        _freeze(parsed)
+        _memory[key] = parsed
+        return parsed
+
+    def cache_clear() -> None:
+        """Drop the in-process entries of this parser."""
+        for key in [key for key in _memory if key.startswith(f"{name}-")]:
+            del _memory[key]
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
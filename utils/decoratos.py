@@ -1,14 +1,183 @@
-from time import time
+"""Timing instrumentation recorded into an in-memory registry.
 
-def timeit(func):
-    """Decorator to time a function's execution."""
+Spans nest, so a ``parse`` span opened while ``part1`` runs is recorded as
+``part1/parse``. Set ``AOC_TIMING=0`` to disable all instrumentation, in which
+case ``timeit`` returns the undecorated function.
+"""
 
+import os
+import threading
+import tracemalloc
+from collections import Counter
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from statistics import median
+from time import perf_counter_ns
+
+_enabled = os.environ.get("AOC_TIMING", "1") != "0"
+_registry: dict[str, "Timing"] = {}
+_local = threading.local()  # Open spans per thread, so parts can run in threads
+
+
+def _stack() -> list[str]:
+    """The open spans of the current thread."""
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@dataclass
+class Timing:
+    """All recorded samples of one span."""
+
+    name: str
+    samples_ns: list[int] = field(default_factory=list)
+    peak_bytes: int | None = None
+    counters: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return len(self.samples_ns)
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.samples_ns)
+
+    @property
+    def median_ns(self) -> float:
+        return median(self.samples_ns)
+
+    @property
+    def p95_ns(self) -> int:
+        """95th percentile, nearest rank."""
+        ordered = sorted(self.samples_ns)
+        return ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "min_ns": self.min_ns,
+            "median_ns": self.median_ns,
+            "p95_ns": self.p95_ns,
+            "peak_bytes": self.peak_bytes,
+            "counters": dict(self.counters),
+        }
+
+
+def set_enabled(enabled: bool) -> None:
+    """Switch recording on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def get_timings() -> dict[str, Timing]:
+    """Return the recorded spans by name, in the order they were first opened."""
+    return dict(_registry)
+
+
+def clear_timings() -> None:
+    """Drop all recorded spans."""
+    _registry.clear()
+
+
+@contextmanager
+def span(name: str, memory: bool = False):
+    """Record the duration of a block as a span nested in the open spans.
+
+    Args:
+        name: Name of the span
+        memory: Also record the peak traced memory with ``tracemalloc``.
+            Starting tracemalloc resets its peak, so only the outermost
+            memory span sees a clean peak.
+    """
+    if not _enabled:
+        yield
+        return
+
+    stack = _stack()
+    stack.append(name)
+    key = "/".join(stack)
+    # Reserve the slot so parents are listed before their children
+    timing = _registry.setdefault(key, Timing(key))
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter_ns() - start
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            timing.peak_bytes = max(timing.peak_bytes or 0, peak)
+            if started_tracing:
+                tracemalloc.stop()
+        timing.samples_ns.append(elapsed)
+        stack.pop()
+
+
+def add_counts(counts: Mapping[str, int]) -> None:
+    """Add counts to the innermost open span of this thread, summed over its runs.
+
+    Does nothing when no span is open or recording is disabled.
+
+    Args:
+        counts: Count per label, like a Counter of the code paths taken
+    """
+    stack = _stack()
+    if _enabled and stack:
+        _registry["/".join(stack)].counters.update(counts)
+
+
+def timeit(func=None, *, name: str | None = None, repeat: int = 1, memory: bool = False):
+    """Decorator to record a function's execution time as a span.
+
+    Can be used bare (``@timeit``) or with options. With ``repeat`` the
+    function is called that many times and the last result is returned, so
+    it must not consume its input (no streams).
+
+    Args:
+        func: The function to decorate
+        name: Span name, defaults to the function name
+        repeat: Number of times to call the function
+        memory: Also record the peak traced memory
+    """
+    if func is None:
+        return lambda f: timeit(f, name=name, repeat=repeat, memory=memory)
+    if not _enabled:
+        return func
+
+    label = name or func.__name__
+
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time()
-        result = func(*args, **kwargs)
-        end_time = time()
-        elapsed_time = end_time - start_time
-        print(f"Function '{func.__name__}' executed in {elapsed_time:.6f} seconds")
+        if not _enabled:
+            return func(*args, **kwargs)
+        for _ in range(repeat):
+            with span(label, memory=memory):
+                result = func(*args, **kwargs)
         return result
 
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def timing_report() -> str:
+    """Format the recorded spans as a table."""
+    lines = [f"{'Span':<30}  {'Count':>5}  {'Min (ms)':>10}  {'Median (ms)':>11}  {'P95 (ms)':>10}  {'Peak (KiB)':>10}"]
+    for timing in _registry.values():
+        if not timing.count:
+            continue
+        depth = timing.name.count("/")
+        label = "  " * depth + timing.name.rsplit("/", 1)[-1]
+        peak = f"{timing.peak_bytes / 1024:.1f}" if timing.peak_bytes is not None else "-"
+        lines.append(
+            f"{label:<30}  {timing.count:>5}  {timing.min_ns / 1e6:>10.3f}  "
+            f"{timing.median_ns / 1e6:>11.3f}  {timing.p95_ns / 1e6:>10.3f}  {peak:>10}"
+        )
+        if timing.counters:
+            counts = ", ".join(f"{label}={count}" for label, count in timing.counters.items())
+            lines.append(f"{'  ' * (depth + 1)}{counts}")
+    return "\n".join(lines)
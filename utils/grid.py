@@ -0,0 +1,162 @@
+"""NumPy engine for character-grid puzzles."""
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+
+from .input_handler import MappedInput
+
+NEWLINE = ord("\n")
+
+# Neighbour offsets (dy, dx) per connectivity
+OFFSETS = {
+    4: [(-1, 0), (0, -1), (0, 1), (1, 0)],
+    8: [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx],
+}
+
+
+def make_lut(mapping: dict[str, int], default: int = 0) -> np.ndarray:
+    """Build a 256 entry byte lookup table.
+
+    Args:
+        mapping: Value per character
+        default: Value for every other byte
+
+    Returns:
+        uint8 array indexed by byte value
+    """
+    lut = np.full(256, default, dtype=np.uint8)
+    for char, value in mapping.items():
+        lut[ord(char)] = value
+    return lut
+
+
+def parse_grid(data: str | bytes | Sequence[str], lut: np.ndarray) -> np.ndarray:
+    """Parse a grid into a uint8 array by translating every byte through a lookup table.
+
+    Args:
+        data: The grid as text with one row per line, or as a sequence of rows
+        lut: Lookup table from make_lut
+
+    Returns:
+        Array of shape (rows, columns)
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        rows = [row.encode() for row in data]
+        if len(rows) == 0 or len({len(row) for row in rows}) > 1:
+            raise ValueError("Grid rows must have equal length")
+        return lut[np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)]
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if len(buf) and buf[-1] == NEWLINE:
+        buf = buf[:-1]
+    newlines = np.flatnonzero(buf == NEWLINE)
+    width = int(newlines[0]) if len(newlines) else len(buf)
+    rows = len(newlines) + 1
+    if len(buf) != rows * (width + 1) - 1 or np.any(newlines != np.arange(1, rows) * (width + 1) - 1):
+        raise ValueError("Grid rows must have equal length")
+    # View the rows without copying, skipping the newline after each
+    return lut[as_strided(buf, shape=(rows, width), strides=(width + 1, 1))]
+
+
+def read_grid(file_path: str | Path, lut: np.ndarray) -> np.ndarray:
+    """Read a grid file into a uint8 array, see parse_grid.
+
+    The file is memory-mapped, so the only full-size allocation is the result.
+    """
+    with MappedInput(file_path) as mapped:
+        return parse_grid(mapped.bytes, lut)
+
+
+def neighbour_counts(grid: np.ndarray, connectivity: int = 8) -> np.ndarray:
+    """Count the non-zero neighbours of every cell, outside the grid counts as zero.
+
+    The padded grid is viewed as 3x3 windows with stride tricks, so no
+    shifted copies are made.
+
+    Args:
+        grid: 2-D array, non-zero cells are counted
+        connectivity: 4 for orthogonal or 8 for orthogonal and diagonal neighbours
+
+    Returns:
+        uint8 array of the same shape with the neighbour counts
+    """
+    padded = np.pad(grid != 0, 1).view(np.uint8)
+    windows = sliding_window_view(padded, (3, 3))
+    counts = np.zeros(grid.shape, dtype=np.uint8)
+    for dy, dx in OFFSETS[connectivity]:
+        counts += windows[:, :, 1 + dy, 1 + dx]
+    return counts
+
+
+def shift(grid: np.ndarray, dy: int, dx: int, out: np.ndarray, fill: int = 0) -> np.ndarray:
+    """Write grid moved by (dy, dx) into a preallocated array.
+
+    Args:
+        grid: Source array
+        dy: Rows to move down, negative moves up
+        dx: Columns to move right, negative moves left
+        out: Destination array of the same shape, not grid itself
+        fill: Value for the cells moved in from outside
+
+    Returns:
+        out
+    """
+    height, width = grid.shape
+    out.fill(fill)
+    if abs(dy) < height and abs(dx) < width:
+        out[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = (
+            grid[max(-dy, 0):height + min(-dy, 0), max(-dx, 0):width + min(-dx, 0)]
+        )
+    return out
+
+
+def bfs_distances(
+    passable: np.ndarray, sources: Iterable[tuple[int, int]], connectivity: int = 4
+) -> np.ndarray:
+    """Breadth-first distance from the nearest source to every reachable cell.
+
+    The whole frontier is expanded per step with array operations on flat
+    indices of a padded grid, so every cell is handled once.
+
+    Args:
+        passable: 2-D array, non-zero cells can be entered
+        sources: (row, column) start cells
+        connectivity: 4 or 8
+
+    Returns:
+        int64 array of distances, -1 for unreachable cells
+
+    Raises:
+        ValueError: If a source lies outside the grid
+    """
+    height, width = passable.shape
+    padded_width = width + 2
+    open_cells = np.pad(passable != 0, 1).ravel()
+    distances = np.full(open_cells.shape, -1, dtype=np.int64)
+    offsets = np.array([dy * padded_width + dx for dy, dx in OFFSETS[connectivity]])
+
+    starts = np.array(list(sources), dtype=np.int64).reshape(-1, 2)
+    rows, columns = starts[:, 0], starts[:, 1]
+    outside = (rows < 0) | (rows >= height) | (columns < 0) | (columns >= width)
+    if outside.any():
+        raise ValueError(f"Source {tuple(starts[outside][0].tolist())} is outside the {height}x{width} grid")
+    frontier = (rows + 1) * padded_width + columns + 1
+    frontier = np.unique(frontier[open_cells[frontier]])
+    distance = 0
+    while len(frontier):
+        distances[frontier] = distance
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[open_cells[candidates] & (distances[candidates] < 0)]
+        frontier = np.unique(candidates)
+        distance += 1
+    return distances.reshape(height + 2, padded_width)[1:-1, 1:-1].copy()
+
+
+def flood_fill(passable: np.ndarray, start: tuple[int, int], connectivity: int = 4) -> np.ndarray:
+    """Boolean mask of the region of passable cells connected to start."""
+    return bfs_distances(passable, [start], connectivity) >= 0
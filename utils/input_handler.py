@@ -1,7 +1,13 @@
 """Utility functions for handling Advent of Code puzzle inputs."""
 
+import mmap
+import os
+from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
 
+import numpy as np
+
 
 def read_input(file_path: str | Path) -> str:
     """Read the entire input file as a single string.
@@ -27,3 +33,128 @@ def read_input_lines(file_path: str | Path) -> list[str]:
     """
     with open(file_path, "r", encoding="utf-8") as f:
         return [line.rstrip("\n") for line in f]
+
+
+def stream_lines(file_path: str | Path) -> Iterator[str]:
+    """Lazily yield the lines of the input file.
+
+    Only one line is held in memory at a time, so inputs larger than RAM can
+    be piped through parts that accept an iterable.
+
+    Args:
+        file_path: Path to the input file
+
+    Yields:
+        Lines from the file (stripped of trailing newlines)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def stream_batches(file_path: str | Path, size: int) -> Iterator[list[str]]:
+    """Lazily yield the lines of the input file in fixed-size batches.
+
+    Args:
+        file_path: Path to the input file
+        size: Number of lines per batch, the last batch may be shorter
+
+    Yields:
+        Lists of lines (stripped of trailing newlines)
+    """
+    for batch in batched(stream_lines(file_path), size):
+        yield list(batch)
+
+
+class MappedInput:
+    """Zero-copy view of an input file through ``mmap``.
+
+    The file is exposed as a memoryview, as a NumPy ``uint8`` array and as a
+    lazy iterator over its lines, without creating Python strings. Newline
+    offsets are computed once, on first use.
+
+    Views handed out stay valid after ``close``. The mapping is then
+    released together with the last of them.
+
+    Example:
+        with MappedInput("input.txt") as mapped:
+            grid = mapped.array[:-1].reshape(rows, -1)
+    """
+
+    def __init__(self, file_path: str | Path):
+        """Map the file read-only.
+
+        Args:
+            file_path: Path to the input file
+        """
+        self._file = open(file_path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            # Empty files cannot be mapped
+            self._mmap = b""
+        self._line_offsets = None
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the file and unmap it unless views handed out are still alive."""
+        if isinstance(self._mmap, mmap.mmap):
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Exported views keep the mapping alive until they are collected
+                pass
+        self._mmap = None
+        self._file.close()
+
+    def _buffer(self) -> mmap.mmap | bytes:
+        """The mapping, raising once the input is closed."""
+        if self._mmap is None:
+            raise ValueError("MappedInput is closed")
+        return self._mmap
+
+    @property
+    def bytes(self) -> memoryview:
+        """The file contents as a read-only memoryview."""
+        return memoryview(self._buffer())
+
+    @property
+    def array(self) -> np.ndarray:
+        """The file contents as a read-only ``uint8`` array."""
+        return np.frombuffer(self._buffer(), dtype=np.uint8)
+
+    @property
+    def line_offsets(self) -> np.ndarray:
+        """Start offset of every line, plus the end of the last line."""
+        if self._line_offsets is None:
+            buf = self.array
+            newlines = np.flatnonzero(buf == 10)
+            # A last line without trailing newline still counts
+            ends = newlines if len(buf) == 0 or buf[-1] == 10 else np.append(newlines, len(buf))
+            self._line_offsets = np.concatenate(([0], ends + 1))
+        return self._line_offsets
+
+    def __len__(self) -> int:
+        """Number of lines in the file."""
+        return len(self.line_offsets) - 1
+
+    def iter_lines(self) -> Iterator[memoryview]:
+        """Lazily yield every line, without its newline, as a memoryview.
+
+        Newlines are searched for as the lines are consumed, so nothing is
+        computed for lines that are never reached.
+        """
+        buffer = self._buffer()
+        view = memoryview(buffer)
+        start = 0
+        while start < len(view):
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                end = len(view)
+            yield view[start:end]
+            start = end + 1
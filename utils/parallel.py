@@ -0,0 +1,115 @@
+"""Process-pool map over independent records, with a serial fallback."""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, chain, islice
+from time import perf_counter
+
+MIN_ITEMS = 10_000  # Below this many items the pool costs more than it saves
+TARGET_CHUNK_SECONDS = 0.05  # Autotuned chunks take about this long per worker
+MAX_CHUNK_SIZE = 1 << 16
+SAMPLE_SECONDS = 0.01  # Time spent timing the first items serially
+
+_executors: dict[int, ProcessPoolExecutor] = {}  # Shared pools by number of workers
+_lock = threading.Lock()
+# Forking a process that runs threads can deadlock the children
+_start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def default_workers() -> int:
+    """Number of worker processes, from ``AOC_WORKERS`` or the core count.
+
+    Inside a worker process of another pool, such as run.py ``--jobs``, this
+    is 1, so pools do not nest into cores squared processes.
+    """
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return int(os.environ.get("AOC_WORKERS", os.cpu_count() or 1))
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for every process pool, forkserver or spawn but never fork."""
+    return multiprocessing.get_context(_start_method)
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool with this many workers, creating it on first use.
+
+    Pools are never replaced while in use, so threads calling parallel_map
+    at the same time can share them.
+    """
+    with _lock:
+        if workers not in _executors:
+            _executors[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+        return _executors[workers]
+
+
+@atexit.register
+def shutdown() -> None:
+    """Shut the shared pools down."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
+
+def _apply_chunk(func: Callable, chunk: tuple) -> list:
+    return [func(item) for item in chunk]
+
+
+def parallel_map(
+    func: Callable,
+    items: Iterable,
+    min_items: int = MIN_ITEMS,
+    chunk_size: int | None = None,
+    workers: int | None = None,
+) -> Iterator:
+    """Lazily map func over items on the shared process pool, in order.
+
+    Inputs with fewer than ``min_items`` items, or a single worker, are
+    mapped serially. Otherwise the first items are timed serially to pick a
+    chunk size that keeps every task around ``TARGET_CHUNK_SECONDS``. Only a
+    few chunks per worker are in flight, so streamed items stay in bounded
+    memory. func and the items must be picklable.
+
+    Args:
+        func: Function applied to every item
+        items: The items, any iterable
+        min_items: Minimum number of items to use the pool
+        chunk_size: Items per task, autotuned when not given
+        workers: Number of processes, defaults to ``default_workers()``
+
+    Yields:
+        func(item) for every item, in order
+    """
+    workers = workers or default_workers()
+    items = iter(items)
+    head = list(islice(items, min_items))
+    if len(head) < min_items or workers < 2:
+        yield from map(func, chain(head, items))
+        return
+
+    if chunk_size is None:
+        sampled = 0
+        start = perf_counter()
+        while sampled < len(head) and perf_counter() - start < SAMPLE_SECONDS:
+            yield func(head[sampled])
+            sampled += 1
+        per_item = (perf_counter() - start) / sampled
+        chunk_size = int(min(max(TARGET_CHUNK_SECONDS / max(per_item, 1e-9), 1), MAX_CHUNK_SIZE))
+        head = head[sampled:]
+
+    executor = get_executor(workers)
+    pending = deque()
+    for chunk in batched(chain(head, items), chunk_size):
+        pending.append(executor.submit(_apply_chunk, func, chunk))
+        if len(pending) >= 2 * workers:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
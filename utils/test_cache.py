@@ -0,0 +1,48 @@
+"""Tests for the parse cache."""
+
+import inspect
+
+import numpy as np
+import pytest
+
+import days.day04.solution as day04
+
+from . import cache
+from .cache import _source_hash, cached_parse, clear_parse_cache
+
+calls = []
+
+
+@cached_parse
+def parse_numbers(data: str) -> np.ndarray:
+    """Count the calls of a small parser."""
+    calls.append(data)
+    return np.array([int(number) for number in data.split(",")])
+
+
+def test_cached_parse_round_trip(parse_cache_dir):
+    """Test the memory and disk levels and that results are read-only."""
+    calls.clear()
+    first = parse_numbers("1,2,3")
+    assert parse_numbers("1,2,3") is first
+    assert list(parse_cache_dir.glob("*parse_numbers-*.npz"))
+
+    clear_parse_cache()
+    loaded = parse_numbers("1,2,3")
+    assert loaded.tolist() == [1, 2, 3]
+    assert calls == ["1,2,3"]
+    with pytest.raises(ValueError):
+        loaded[0] = 0
+
+
+def test_source_hash_covers_utils_helpers(monkeypatch):
+    """Test that editing a utils helper used by a day changes its cache key."""
+    before = _source_hash(day04)
+    getsource = inspect.getsource
+
+    def edited(module):
+        source = getsource(module)
+        return source + "\n# edited\n" if module.__name__ == "utils.grid" else source
+
+    monkeypatch.setattr(cache.inspect, "getsource", edited)
+    assert _source_hash(day04) != before
@@ -0,0 +1,119 @@
+"""Tests for the timing spans."""
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from . import decoratos
+from .decoratos import Timing, add_counts, clear_timings, get_timings, span, timeit, timing_report
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Record into an empty registry, with recording on."""
+    monkeypatch.setattr(decoratos, "_enabled", True)
+    clear_timings()
+    yield
+    clear_timings()
+
+
+def test_span_nesting():
+    """Test that nested spans are keyed by their path, parents first."""
+    with span("part1"):
+        with span("parse"):
+            add_counts({"fast": 2})
+        with span("parse"):
+            add_counts({"fast": 1, "slow": 1})
+        add_counts({"outer": 1})
+    with span("parse"):
+        pass
+
+    timings = get_timings()
+    assert list(timings) == ["part1", "part1/parse", "parse"]
+    assert timings["part1/parse"].count == 2
+    assert timings["part1/parse"].counters == {"fast": 3, "slow": 1}
+    assert timings["part1"].counters == {"outer": 1}
+    assert timings["part1"].min_ns >= timings["part1/parse"].samples_ns[0]
+    report = timing_report().splitlines()
+    assert report[1].startswith("part1 ")
+    assert report[3].startswith("  parse ")
+    assert report[4].strip() == "fast=3, slow=1"
+
+
+def test_span_closes_on_error():
+    """Test that a span raising is recorded and leaves the stack clean."""
+    with pytest.raises(RuntimeError):
+        with span("part1"):
+            raise RuntimeError
+    with span("part2"):
+        pass
+    assert list(get_timings()) == ["part1", "part2"]
+    assert get_timings()["part1"].count == 1
+
+
+def test_spans_per_thread():
+    """Test that spans opened in another thread do not nest in this one."""
+    with span("part1"):
+        thread = threading.Thread(target=lambda: timeit(lambda: None, name="part2")())
+        thread.start()
+        thread.join()
+    assert set(get_timings()) == {"part1", "part2"}
+
+
+def test_timing_statistics():
+    """Test min, median and the nearest-rank 95th percentile."""
+    timing = Timing("part1", samples_ns=list(range(100, 0, -1)))
+    assert (timing.count, timing.min_ns, timing.median_ns, timing.p95_ns) == (100, 1, 50.5, 95)
+    single = Timing("part1", samples_ns=[7])
+    assert (single.min_ns, single.median_ns, single.p95_ns) == (7, 7, 7)
+    assert Timing("part1", samples_ns=[3, 1, 2]).to_dict() == {
+        "name": "part1",
+        "count": 3,
+        "min_ns": 1,
+        "median_ns": 2,
+        "p95_ns": 3,
+        "peak_bytes": None,
+        "counters": {},
+    }
+
+
+def test_timeit_repeat_and_memory():
+    """Test that repeats are recorded as samples and the last result returned."""
+    calls = []
+
+    @timeit(name="solve", repeat=3, memory=True)
+    def solve(n):
+        calls.append(n)
+        return list(range(n))
+
+    assert solve(1000) == list(range(1000))
+    assert len(calls) == 3
+    timing = get_timings()["solve"]
+    assert timing.count == 3
+    assert timing.peak_bytes > 0
+
+
+def test_disabled_passthrough(monkeypatch):
+    """Test that disabled timing returns the function undecorated and records nothing."""
+
+    def solve():
+        with span("parse"):
+            add_counts({"fast": 1})
+        return 1
+
+    monkeypatch.setattr(decoratos, "_enabled", False)
+    assert timeit(solve) is solve
+    assert timeit(name="solve", repeat=3)(solve) is solve
+    assert solve() == 1
+    assert get_timings() == {}
+
+
+def test_aoc_timing_environment():
+    """Test that AOC_TIMING=0 disables timing at import."""
+    code = "from utils.decoratos import timeit; f = lambda: 1; assert timeit(f) is f"
+    env = {**os.environ, "AOC_TIMING": "0"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, cwd=Path(__file__).parents[1])
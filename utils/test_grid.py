@@ -0,0 +1,90 @@
+"""Tests for the grid engine."""
+
+import numpy as np
+import pytest
+
+from .grid import bfs_distances, flood_fill, make_lut, neighbour_counts, parse_grid, read_grid, shift
+
+MAZE = """\
+..#.
+.##.
+....
+##.#
+"""
+LUT = make_lut({".": 1})
+
+
+@pytest.fixture
+def passable():
+    """The maze as 1 for open and 0 for wall cells."""
+    return parse_grid(MAZE, LUT)
+
+
+def test_parse_and_read_grid(tmp_path, passable):
+    """Test that text, rows and a mapped file parse to the same array."""
+    path = tmp_path / "maze.txt"
+    path.write_text(MAZE)
+    assert passable.tolist() == [[1, 1, 0, 1], [1, 0, 0, 1], [1, 1, 1, 1], [0, 0, 1, 0]]
+    assert np.array_equal(parse_grid(MAZE.splitlines(), LUT), passable)
+    assert np.array_equal(read_grid(path, LUT), passable)
+    path.write_text("..\n.\n")
+    with pytest.raises(ValueError):
+        read_grid(path, LUT)
+    # Same total length as a rectangle, but uneven rows
+    for uneven in (b"abc\nd\nefghi", "ab\nabcd\n", ["ab", "abcd"], ["abc", "d", "efghi", "j"]):
+        with pytest.raises(ValueError):
+            parse_grid(uneven, LUT)
+
+
+def test_neighbour_counts(passable):
+    """Test orthogonal and full neighbour counts with a zero border."""
+    assert neighbour_counts(passable, connectivity=4)[0].tolist() == [2, 1, 2, 1]
+    assert neighbour_counts(passable, connectivity=8)[2].tolist() == [2, 4, 4, 3]
+
+
+@pytest.mark.parametrize("dy, dx", [(0, 0), (1, 0), (0, -1), (-2, 3), (4, 0), (0, -5)])
+def test_shift(dy, dx):
+    """Test shifts against np.roll with the wrapped cells filled."""
+    grid = np.arange(12, dtype=np.int64).reshape(3, 4)
+    out = np.empty_like(grid)
+    assert shift(grid, dy, dx, out, fill=-1) is out
+
+    expected = np.roll(grid, (dy, dx), axis=(0, 1))
+    rows, columns = np.indices(grid.shape)
+    moved_in = (rows - dy < 0) | (rows - dy >= 3) | (columns - dx < 0) | (columns - dx >= 4)
+    expected[moved_in] = -1
+    assert np.array_equal(out, expected)
+
+
+def test_bfs_distances(passable):
+    """Test distances, unreachable cells and closed sources."""
+    assert bfs_distances(passable, [(0, 0)]).tolist() == [
+        [0, 1, -1, 7],
+        [1, -1, -1, 6],
+        [2, 3, 4, 5],
+        [-1, -1, 5, -1],
+    ]
+    assert bfs_distances(passable, [(0, 0)], connectivity=8)[0, 3] == 5
+    both = bfs_distances(passable, [(0, 0), (0, 3)])
+    assert both[2].tolist() == [2, 3, 3, 2]
+    assert (bfs_distances(passable, [(0, 2)]) == -1).all()
+    assert (bfs_distances(passable, []) == -1).all()
+
+
+@pytest.mark.parametrize("source", [(4, 0), (0, 4), (-1, 0), (0, -1), (1, 5)])
+def test_bfs_distances_source_outside(passable, source):
+    """Test that sources outside the grid are rejected."""
+    with pytest.raises(ValueError, match="outside"):
+        bfs_distances(passable, [(0, 0), source])
+
+
+def test_flood_fill():
+    """Test that the region stops at walls."""
+    passable = parse_grid("..#.\n..#.\n##..\n", LUT)
+    assert flood_fill(passable, (0, 0)).tolist() == [
+        [True, True, False, False],
+        [True, True, False, False],
+        [False, False, False, False],
+    ]
+    assert flood_fill(passable, (0, 3)).sum() == 4
+    assert flood_fill(passable, (2, 2), connectivity=8)[1, 1]
@@ -0,0 +1,83 @@
+"""Tests for the input readers."""
+
+import numpy as np
+import pytest
+
+from .input_handler import MappedInput, read_input_lines, stream_batches, stream_lines
+
+
+@pytest.fixture
+def grid_file(tmp_path):
+    """A small grid file with a trailing newline."""
+    path = tmp_path / "grid.txt"
+    path.write_bytes(b"ab\ncd\nef\n")
+    return path
+
+
+def test_stream_lines(tmp_path):
+    """Test that streamed lines match the eager reader, lazily."""
+    path = tmp_path / "lines.txt"
+    path.write_text("a\n\nbc\nd")
+    lines = stream_lines(path)
+    assert next(lines) == "a"
+    assert list(lines) == ["", "bc", "d"]
+    assert list(stream_lines(path)) == read_input_lines(path)
+
+
+def test_stream_lines_empty(tmp_path):
+    """Test that an empty file yields no lines."""
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert list(stream_lines(path)) == []
+    assert list(stream_batches(path, 2)) == []
+
+
+def test_stream_batches(grid_file):
+    """Test full batches and a shorter last batch."""
+    assert list(stream_batches(grid_file, 2)) == [["ab", "cd"], ["ef"]]
+    assert list(stream_batches(grid_file, 3)) == [["ab", "cd", "ef"]]
+    with pytest.raises(ValueError):
+        next(stream_batches(grid_file, 0))
+
+
+def test_mapped_input(grid_file):
+    """Test the bytes, array and line views of a mapped file."""
+    with MappedInput(grid_file) as mapped:
+        assert bytes(mapped.bytes) == b"ab\ncd\nef\n"
+        assert mapped.array.dtype == np.uint8
+        assert len(mapped) == 3
+        assert mapped.line_offsets.tolist() == [0, 3, 6, 9]
+        assert [bytes(line) for line in mapped.iter_lines()] == [b"ab", b"cd", b"ef"]
+
+
+def test_mapped_input_without_trailing_newline(tmp_path):
+    """Test that a last line without newline and empty lines are kept."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"a\n\nbc")
+    with MappedInput(path) as mapped:
+        assert [bytes(line) for line in mapped.iter_lines()] == [b"a", b"", b"bc"]
+        assert len(mapped) == 3
+
+
+def test_mapped_input_empty(tmp_path):
+    """Test that an empty file can be opened."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with MappedInput(path) as mapped:
+        assert len(mapped.array) == 0
+        assert list(mapped.iter_lines()) == []
+        assert len(mapped) == 0
+
+
+def test_mapped_input_views_outlive_close(grid_file):
+    """Test that views still alive at exit neither raise nor go stale."""
+    with MappedInput(grid_file) as mapped:
+        grid = mapped.array[:-1]
+        raw = mapped.bytes
+        lines = mapped.iter_lines()
+        first = next(lines)
+    assert bytes(grid[:2]) == b"ab"
+    assert bytes(raw[3:5]) == b"cd"
+    assert bytes(first) == b"ab"
+    with pytest.raises(ValueError):
+        mapped.array
@@ -0,0 +1,42 @@
+"""Tests for the process-pool map."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from .parallel import default_workers, parallel_map, pool_context
+
+square = partial(pow, exp=2)
+
+
+def test_parallel_map_pool_matches_serial():
+    """Test that the pool path gives the serial results, in order."""
+    items = range(2000)
+    expected = [square(item) for item in items]
+    assert list(parallel_map(square, items, min_items=1, workers=2)) == expected
+    assert list(parallel_map(square, iter(items), min_items=1, chunk_size=7, workers=2)) == expected
+
+
+def test_parallel_map_serial_below_min_items():
+    """Test that short inputs and a single worker are mapped serially."""
+    assert list(parallel_map(square, range(5), min_items=10, workers=2)) == [0, 1, 4, 9, 16]
+    assert list(parallel_map(square, range(5), min_items=1, workers=1)) == [0, 1, 4, 9, 16]
+
+
+def test_parallel_map_from_threads():
+    """Test that threads can share the pools, also with different sizes."""
+    items = range(1000)
+    expected = [square(item) for item in items]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(lambda workers: list(parallel_map(square, items, min_items=1, workers=workers)), workers)
+            for workers in (2, 2, 3, 3)
+        ]
+        assert all(future.result() == expected for future in futures)
+
+
+def test_default_workers_in_pool_worker(monkeypatch):
+    """Test that a worker of another pool maps serially instead of nesting a pool."""
+    monkeypatch.setenv("AOC_WORKERS", "3")
+    assert default_workers() == 3
+    with ProcessPoolExecutor(max_workers=1, mp_context=pool_context()) as executor:
+        assert executor.submit(default_workers).result() == 1
@@ -0,0 +1,118 @@
+"""Tiled, bit-packed storage for very large and mostly empty boolean grids."""
+
+from collections.abc import Iterable, Iterator
+from itertools import batched
+
+import numpy as np
+
+from .grid import neighbour_counts, parse_grid
+
+Tile = tuple[int, int]
+
+
+class TiledGrid:
+    """Boolean grid stored as bit-packed square tiles.
+
+    Tiles without any set cell are not stored at all. Work is done one tile
+    at a time, with a one cell halo copied in from the neighbouring tiles,
+    so only a few unpacked tiles are in memory at once.
+    """
+
+    def __init__(self, shape: tuple[int, int], tile_size: int = 256):
+        """Create an empty grid.
+
+        Args:
+            shape: (rows, columns) of the whole grid
+            tile_size: Side of the square tiles
+        """
+        self.shape = shape
+        self.tile_size = tile_size
+        self.tiles: dict[Tile, np.ndarray] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], lut: np.ndarray, tile_size: int = 256) -> "TiledGrid":
+        """Build a grid from rows of text, one band of tile_size rows at a time.
+
+        Args:
+            lines: Equally long rows, any iterable
+            lut: Byte lookup table, non-zero values are set cells
+            tile_size: Side of the square tiles
+
+        Returns:
+            The tiled grid
+        """
+        grid = cls((0, 0), tile_size)
+        rows = width = 0
+        for ty, band in enumerate(batched((line for line in lines if line), tile_size)):
+            cells = parse_grid(band, lut) != 0
+            width = cells.shape[1]
+            rows += cells.shape[0]
+            for tx in range(-(-width // tile_size)):
+                grid.set_tile((ty, tx), cells[:, tx * tile_size:(tx + 1) * tile_size])
+        grid.shape = (rows, width)
+        return grid
+
+    def copy(self) -> "TiledGrid":
+        """Copy the grid, tiles are replaced rather than modified so they are shared."""
+        grid = TiledGrid(self.shape, self.tile_size)
+        grid.tiles = dict(self.tiles)
+        return grid
+
+    @property
+    def grid_shape(self) -> Tile:
+        """Number of tiles along each axis."""
+        return tuple(-(-n // self.tile_size) for n in self.shape)
+
+    def tile_shape(self, tile: Tile) -> tuple[int, int]:
+        """Shape of a tile, tiles at the far edges may be smaller."""
+        return tuple(
+            min(self.tile_size, n - t * self.tile_size) for t, n in zip(tile, self.shape)
+        )
+
+    def get_tile(self, tile: Tile) -> np.ndarray | None:
+        """Unpack a tile into a boolean array, None when the tile is empty."""
+        packed = self.tiles.get(tile)
+        if packed is None:
+            return None
+        return np.unpackbits(packed, axis=1, count=self.tile_shape(tile)[1]).view(bool)
+
+    def set_tile(self, tile: Tile, cells: np.ndarray) -> None:
+        """Pack and store a tile, dropping it when it is empty."""
+        if cells.any():
+            self.tiles[tile] = np.packbits(cells, axis=1)
+        else:
+            self.tiles.pop(tile, None)
+
+    def count(self) -> int:
+        """Number of set cells."""
+        return sum(int(np.unpackbits(packed).sum()) for packed in self.tiles.values())
+
+    def neighbours(self, tile: Tile) -> Iterator[Tile]:
+        """The stored tiles around a tile, including the tile itself."""
+        ty, tx = tile
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if (ty + dy, tx + dx) in self.tiles:
+                    yield (ty + dy, tx + dx)
+
+    def with_halo(self, tile: Tile) -> np.ndarray:
+        """A tile with a one cell border copied in from its neighbours."""
+        height, width = self.tile_shape(tile)
+        out = np.zeros((height + 2, width + 2), dtype=bool)
+        # For each offset: the slice taken from the neighbour, and where it goes
+        offsets = {
+            -1: (slice(-1, None), slice(0, 1)),
+            0: (slice(None), slice(1, -1)),
+            1: (slice(0, 1), slice(-1, None)),
+        }
+        ty, tx = tile
+        for dy, (source_rows, target_rows) in offsets.items():
+            for dx, (source_columns, target_columns) in offsets.items():
+                cells = self.get_tile((ty + dy, tx + dx))
+                if cells is not None:
+                    out[target_rows, target_columns] = cells[source_rows, source_columns]
+        return out
+
+    def neighbour_counts(self, tile: Tile, connectivity: int = 8) -> np.ndarray:
+        """Count the set neighbours of every cell in a tile, across tile borders."""
+        return neighbour_counts(self.with_halo(tile), connectivity)[1:-1, 1:-1]